@@ -1,8 +1,24 @@
 import tkinter as tk
 from tkinter import ttk
-from collections import defaultdict
-from collections import deque
-import random
+from tkinter import messagebox
+from tkinter import filedialog
+import os
+import queue
+from array import array
+import sys
+import threading
+import time
+
+from rr_checkpoint import load_checkpoint, save_checkpoint
+from rr_engine import IDLE, OVERHEAD, QUEUE_MODES, ProcessTable, make_engine, zeros
+from rr_export import (EXPORT_FORMATS, IDLE_COLOR, MAX_PROCESS_ROWS, OVERHEAD_COLOR, TABLE_FORMATS,
+                       export_gantt, export_processes, palette)
+from rr_io import FORMATS, load_workload
+from rr_policy import POLICIES
+from rr_profile import Instrument, memory_usage
+from rr_stats import compute_stats
+from rr_sweep import parse_quanta, sweep, write_sweep_csv
+from rr_workload import ARRIVAL_MODELS, BURST_MODELS, generate
 
 class EnhancedRoundRobinSimulator:
     def __init__(self, root):
@@ -15,48 +31,93 @@ class EnhancedRoundRobinSimulator:
         self.root.grid_rowconfigure(0, weight=1)  # Row for Input and Timeline
         self.root.grid_rowconfigure(1, weight=2)  # Row for Visual + Stats
         self.root.grid_rowconfigure(2, weight=1) 
+        self.root.grid_rowconfigure(3, weight=0)  # Collapsible diagnostics
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_columnconfigure(1, weight=1)
 
-        # Process data
-        self.processes = []
-        self.burst_times = []
-        self.arrival_times = []
+        # Process data, one row per pid
+        self.table = ProcessTable()
+        self.loaded_table = None  # trace opened from a file, used instead of the entries
         self.time_quantum = 0
         self.simulation_running = False
         self.after_id = None
-        self.speed = tk.IntVar(value=800)  # Animation speed in ms
-
-        # Statistics tracking
-        self.waiting_times = defaultdict(int)
-        self.turnaround_times = defaultdict(int)
-        self.response_times = {}
-        self.first_run = set()
-        self.completion_times = []
-        self.gantt_chart = []
+        self.speed = tk.DoubleVar(value=2.4)  # playback speed, 10 ** (speed / 25) slices per second
+        self.instant = tk.BooleanVar(value=False)  # replay as fast as frames allow
+
+        # Playback: a worker thread simulates ahead while the Tk thread draws
+        # whatever slices are due at a fixed frame rate
+        self.engine = None
+        self.worker = None
+        self.worker_stop = None
+        self.frame_ms = 33
+        self.max_slices_per_frame = 5000
+        self.engine_chunk = 2000  # slices simulated between progress updates
+        self.engine_lookahead = 200000  # slices the worker may run ahead of playback
+
+        # Statistics tracking; the slices shown so far are result.gantt[:replay_index]
+        self.result = None
+        self.replay_index = 0
+        self.completion_times = zeros(0)
+        self.run_stats = None  # RunStats of the finished run
+        self.stats_page = 0
+        self.stats_page_size = 200
+
+        # Diagnostics: an Instrument is only attached to runs started while
+        # instrumentation is ticked, so other runs execute no timing code
+        self.instrument = None
+        self.diagnostics_enabled = tk.BooleanVar(value=False)
+        self.profile_enabled = tk.BooleanVar(value=False)
+        self.diagnostics_open = False
+        self.diagnostics_refresh_frames = 15
 
         # Visualization parameters
         self.block_width = 70
         self.block_height = 50
         self.block_gap = 5
-        self.x_offset = 20
-        self.y_offset = 50
-        self.current_row = 0
+        self.x_offset = 20  # left edge of the block grid
+        self.y_offset = 50  # top edge of the block grid
+        self.row_height = self.block_height + 10
         self.max_row_width = 900
+        self.blocks_per_row = (self.max_row_width - self.x_offset - self.block_width) // \
+            (self.block_width + self.block_gap) + 1
+
+        # Multi-core runs draw one lane per core in both canvases
+        self.lane_count = 0  # cores of the current run, 0 for a single CPU
+        self.lane_label_width = 50
+        self.lane_slots = (self.max_row_width - self.x_offset - self.lane_label_width - self.block_width) // \
+            (self.block_width + self.block_gap) + 1
 
-        # Color scheme with diverse colors
-        self.process_colors = [
-            '#e6194b', '#3cb44b', '#ffe119', '#f58231',
-            '#46f0f0', '#f032e6', '#bcf60c', '#fabebe',
-            '#fffac8', '#aaffc3', '#ffd8b1'
-        ]
+        # Process colors (rr_export.PROCESS_COLORS) are shuffled with a fixed
+        # seed so the same workload always gets the same colors, in the GUI
+        # and in exported charts
+        self.color_seed = 0
 
         # Create all frames
+        self.create_menu()
         self.create_input_frame()
         self.create_execution_frame()
         self.create_visualization_frame()
         self.create_statistics_frame()
         self.create_time_usage_frame()
+        self.create_diagnostics_frame()
+
+    def create_menu(self):
+        menubar = tk.Menu(self.root)
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Open Trace...", command=self.open_trace)
+        file_menu.add_command(label="Generate Workload...", command=self.open_generator_window)
+        file_menu.add_command(label="Clear Trace", command=self.clear_trace)
+        file_menu.add_separator()
+        file_menu.add_command(label="Save Checkpoint...", command=self.save_checkpoint)
+        file_menu.add_command(label="Open Checkpoint...", command=self.open_checkpoint)
+        file_menu.add_separator()
+        file_menu.add_command(label="Export Gantt...", command=lambda: self.export_results('gantt'))
+        file_menu.add_command(label="Export Statistics...", command=lambda: self.export_results('processes'))
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.exit)
+        menubar.add_cascade(label="File", menu=file_menu)
+        self.root.config(menu=menubar)
+        self.root.protocol("WM_DELETE_WINDOW", self.exit)
 
     def create_input_frame(self):
         input_frame = tk.LabelFrame(self.root, text="Process Input", padx=10, pady=10, 
@@ -92,9 +153,51 @@ class EnhancedRoundRobinSimulator:
                                      insertbackground='white', font=('Consolas', 9))
         self.quantum_entry.grid(row=3, column=1, padx=5, pady=5)
 
+        # Priority input, used by the priority policy (lower runs first)
+        tk.Label(input_frame, text="Priorities (optional):", 
+                bg='#1E1E1E', fg='#FFFFFF', font=('Consolas', 9)).grid(row=4, column=0, sticky='w')
+        self.priority_entry = tk.Entry(input_frame, width=30, bg='#2D2D2D', fg='#FFFFFF',
+                                      insertbackground='white', font=('Consolas', 9))
+        self.priority_entry.grid(row=4, column=1, padx=5, pady=5)
+
+        # Scheduling policy
+        tk.Label(input_frame, text="Policy:", 
+                bg='#1E1E1E', fg='#FFFFFF', font=('Consolas', 9)).grid(row=5, column=0, sticky='w')
+        self.policy_names = {policy.label: name for name, policy in POLICIES.items()}
+        self.policy_choice = ttk.Combobox(input_frame, width=28, state='readonly',
+                                         values=list(self.policy_names), font=('Consolas', 9))
+        self.policy_choice.set(POLICIES['rr'].label)
+        self.policy_choice.grid(row=5, column=1, padx=5, pady=5)
+
+        # CPU count and ready queue layout
+        tk.Label(input_frame, text="Cores:", 
+                bg='#1E1E1E', fg='#FFFFFF', font=('Consolas', 9)).grid(row=6, column=0, sticky='w')
+        core_frame = tk.Frame(input_frame, bg='#1E1E1E')
+        core_frame.grid(row=6, column=1, padx=5, pady=5, sticky='w')
+        self.cores = tk.IntVar(value=1)
+        tk.Spinbox(core_frame, from_=1, to=1024, width=5, textvariable=self.cores,
+                  bg='#2D2D2D', fg='#FFFFFF', buttonbackground='#2D2D2D',
+                  insertbackground='white', font=('Consolas', 9)).pack(side=tk.LEFT)
+        self.queue_mode = ttk.Combobox(core_frame, width=18, state='readonly', values=QUEUE_MODES,
+                                      font=('Consolas', 9))
+        self.queue_mode.set(QUEUE_MODES[0])
+        self.queue_mode.pack(side=tk.LEFT, padx=(5, 0))
+
+        # Dispatch overhead: context switch cost and cache warm-up penalty
+        tk.Label(input_frame, text="Switch cost / warm-up:", 
+                bg='#1E1E1E', fg='#FFFFFF', font=('Consolas', 9)).grid(row=7, column=0, sticky='w')
+        overhead_frame = tk.Frame(input_frame, bg='#1E1E1E')
+        overhead_frame.grid(row=7, column=1, padx=5, pady=5, sticky='w')
+        self.switch_cost = tk.IntVar(value=0)
+        self.warmup = tk.IntVar(value=0)
+        for variable in (self.switch_cost, self.warmup):
+            tk.Spinbox(overhead_frame, from_=0, to=1000, width=5, textvariable=variable,
+                      bg='#2D2D2D', fg='#FFFFFF', buttonbackground='#2D2D2D',
+                      insertbackground='white', font=('Consolas', 9)).pack(side=tk.LEFT, padx=(0, 5))
+
         # Control buttons
         button_frame = tk.Frame(input_frame, bg='#1E1E1E')
-        button_frame.grid(row=4, column=0, columnspan=2, pady=(5,0))
+        button_frame.grid(row=8, column=0, columnspan=2, pady=(5,0))
         
         self.start_btn = tk.Button(button_frame, text="Start", command=self.start_simulation,
                                  bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
@@ -111,14 +214,51 @@ class EnhancedRoundRobinSimulator:
                                   activeforeground='#FFFFFF', font=('Consolas', 9, 'bold'))
         self.reset_btn.pack(side=tk.LEFT, padx=5)
 
+        self.sweep_btn = tk.Button(button_frame, text="Sweep...", command=self.open_sweep_window,
+                                  bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                                  activeforeground='#FFFFFF', font=('Consolas', 9, 'bold'))
+        self.sweep_btn.pack(side=tk.LEFT, padx=5)
+
+
+        # Loaded trace, if any
+        self.trace_status = tk.StringVar(value="")
+        tk.Label(input_frame, textvariable=self.trace_status, bg='#1E1E1E', fg='#4ECDC4',
+                font=('Consolas', 9)).grid(row=9, column=0, columnspan=2, sticky='w')
+
+        # Jump playback to a time index
+        seek_frame = tk.Frame(input_frame, bg='#1E1E1E')
+        seek_frame.grid(row=9, column=2, columnspan=2, sticky='w', padx=5)
+        tk.Label(seek_frame, text="Seek to time:", bg='#1E1E1E', fg='#FFFFFF',
+                font=('Consolas', 9)).pack(side=tk.LEFT)
+        self.seek_entry = tk.Entry(seek_frame, width=10, bg='#2D2D2D', fg='#FFFFFF',
+                                  insertbackground='white', font=('Consolas', 9))
+        self.seek_entry.pack(side=tk.LEFT, padx=5)
+        self.seek_entry.bind('<Return>', lambda e: self.seek())
+        tk.Button(seek_frame, text="Seek", command=self.seek,
+                 bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                 activeforeground='#FFFFFF', font=('Consolas', 8)).pack(side=tk.LEFT)
 
         # Speed control
         speed_frame = tk.Frame(input_frame, bg='#1E1E1E')
-        speed_frame.grid(row=4, column=2, columnspan=2, sticky='n', padx=5)
-        tk.Label(speed_frame, text="Animation Speed:", bg='#1E1E1E', fg='#FFFFFF',
+        speed_frame.grid(row=8, column=2, columnspan=2, sticky='n', padx=5)
+        tk.Label(speed_frame, text="Speed:", bg='#1E1E1E', fg='#FFFFFF',
                 font=('Consolas', 9)).pack(side=tk.LEFT)
-        ttk.Scale(speed_frame, from_=100, to=2000, variable=self.speed, orient=tk.HORIZONTAL,
-                 command=lambda _: None).pack(side=tk.LEFT, padx=5)
+        ttk.Scale(speed_frame, from_=0, to=100, variable=self.speed, orient=tk.HORIZONTAL,
+                 command=self.update_speed_label).pack(side=tk.LEFT, padx=5)
+        self.speed_label = tk.Label(speed_frame, width=10, anchor='w', bg='#1E1E1E', fg='#FFFFFF',
+                                   font=('Consolas', 9))
+        self.speed_label.pack(side=tk.LEFT)
+        tk.Checkbutton(speed_frame, text="Instant", variable=self.instant, bg='#1E1E1E', fg='#FFFFFF',
+                      selectcolor='#2D2D2D', activebackground='#1E1E1E', activeforeground='#FFFFFF',
+                      font=('Consolas', 9)).pack(side=tk.LEFT)
+        self.update_speed_label()
+
+    def slices_per_second(self):
+        return 10 ** (self.speed.get() / 25)
+
+    def update_speed_label(self, *args):
+        rate = self.slices_per_second()
+        self.speed_label.config(text=f"{rate:.1f}/s" if rate < 10 else f"{rate:.0f}/s")
 
     def create_execution_frame(self):
         exec_frame = tk.LabelFrame(self.root, text="Execution Timeline", padx=10, pady=10,
@@ -127,6 +267,28 @@ class EnhancedRoundRobinSimulator:
         exec_frame.configure(height=230)
         exec_frame.grid_propagate(False)
 
+        # Log options: messages are buffered and flushed once per frame, the
+        # widget keeps at most log_max_lines and older lines spill to log_file
+        self.log_buffer = []
+        self.log_flush_id = None
+        self.log_file = None
+        self.log_verbose = tk.BooleanVar(value=True)
+        self.log_max_lines = tk.IntVar(value=1000)
+
+        log_options = tk.Frame(exec_frame, bg='#1E1E1E')
+        log_options.pack(side=tk.TOP, fill=tk.X, pady=(0, 5))
+        tk.Checkbutton(log_options, text="Verbose", variable=self.log_verbose,
+                      bg='#1E1E1E', fg='#FFFFFF', selectcolor='#2D2D2D', activebackground='#1E1E1E',
+                      activeforeground='#FFFFFF', font=('Consolas', 9)).pack(side=tk.LEFT)
+        tk.Label(log_options, text="Keep lines:", bg='#1E1E1E', fg='#FFFFFF',
+                font=('Consolas', 9)).pack(side=tk.LEFT, padx=(10, 0))
+        tk.Spinbox(log_options, from_=100, to=100000, increment=100, width=7, textvariable=self.log_max_lines,
+                  bg='#2D2D2D', fg='#FFFFFF', insertbackground='white', font=('Consolas', 9)).pack(side=tk.LEFT, padx=5)
+        self.log_file_btn = tk.Button(log_options, text="Log to file...", command=self.choose_log_file,
+                                     bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                                     activeforeground='#FFFFFF', font=('Consolas', 8))
+        self.log_file_btn.pack(side=tk.RIGHT)
+
         self.timeline_text = tk.Text(exec_frame, width=50, height=15, wrap=tk.WORD,
                                     bg='#2D2D2D', fg='#FFFFFF', insertbackground='white',
                                     font=('Consolas', 10))
@@ -149,14 +311,40 @@ class EnhancedRoundRobinSimulator:
         tk.Label(vis_frame, textvariable=self.current_process, 
                 bg='#1E1E1E', fg='#4ECDC4', font=('Consolas', 12, 'bold')).pack(anchor='w')
 
-        self.canvas = tk.Canvas(vis_frame, bg='#1E1E1E',highlightthickness=0)
-        self.canvas.pack(fill=tk.BOTH, expand=True)
+        canvas_frame = tk.Frame(vis_frame, bg='#1E1E1E')
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(canvas_frame, bg='#1E1E1E',highlightthickness=0)
+        scrollbar = tk.Scrollbar(canvas_frame, command=self.scroll_blocks,
+                                bg='#1E1E1E', troughcolor='#2D2D2D', activebackground='#3D3D3D')
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.config(yscrollcommand=scrollbar.set)
+
+        # Only the visible rows exist as canvas items; they are recycled on scroll
+        self.clear_block_view()
+        self.canvas.bind('<Configure>', lambda e: self.refresh_block_view())
+        self.canvas.bind('<MouseWheel>', lambda e: self.scroll_blocks('scroll', -e.delta // 120, 'units'))
+        self.canvas.bind('<Button-4>', lambda e: self.scroll_blocks('scroll', -1, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.scroll_blocks('scroll', 1, 'units'))
 
     def create_statistics_frame(self):
         stats_frame = tk.LabelFrame(self.root, text="Process Statistics", padx=10, pady=10,
                                   bg='#1E1E1E', fg='#FFFFFF', font=('Consolas', 10, 'bold'))
         stats_frame.grid(row=1, column=1, padx=10, pady=10, sticky='nsew')
 
+        # The table is paged so large runs never build a huge Text widget
+        page_frame = tk.Frame(stats_frame, bg='#1E1E1E')
+        page_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+        tk.Button(page_frame, text="< Prev", command=lambda: self.turn_stats_page(-1),
+                 bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                 activeforeground='#FFFFFF', font=('Consolas', 8)).pack(side=tk.LEFT)
+        tk.Button(page_frame, text="Next >", command=lambda: self.turn_stats_page(1),
+                 bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                 activeforeground='#FFFFFF', font=('Consolas', 8)).pack(side=tk.RIGHT)
+        self.stats_page_label = tk.Label(page_frame, text="Page 1/1", bg='#1E1E1E', fg='#FFFFFF',
+                                        font=('Consolas', 9))
+        self.stats_page_label.pack()
+
         self.stats_text = tk.Text(stats_frame, width=40, height=10, state=tk.DISABLED,
                                  bg='#2D2D2D', fg='#FFFFFF', font=('Consolas', 10))
         self.stats_text.pack(side=tk.LEFT,fill=tk.BOTH, expand=True)
@@ -170,68 +358,214 @@ class EnhancedRoundRobinSimulator:
                                  bg='#1E1E1E', fg='#FFFFFF', font=('Consolas', 10, 'bold'))
         time_frame.grid(row=2, column=0, columnspan=2, padx=10, pady=10, sticky='nsew')
 
+        tk.Button(time_frame, text="Redraw", command=self.redraw_time_usage,
+                 bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                 activeforeground='#FFFFFF', font=('Consolas', 8)).pack(anchor='e')
+
         self.time_canvas = tk.Canvas(time_frame, bg='#1E1E1E',height=250, highlightthickness=0)
         self.time_canvas.pack(fill=tk.BOTH, expand=True)
 
-    def get_process_color(self, process_name):
-        return self.process_color_map.get(process_name, '#FFFFFF')  # Default to white if not found
-
+        # Full redraws only happen on resize or via the Redraw button
+        self.resize_after_id = None
+        self.usage_target = 0
+        self.clear_time_usage()
+        self.time_canvas.bind('<Configure>', self.on_time_canvas_resize)
+
+    def create_diagnostics_frame(self):
+        diag_frame = tk.Frame(self.root, bg='#1E1E1E', padx=10, pady=5)
+        diag_frame.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 10), sticky='nsew')
+
+        header = tk.Frame(diag_frame, bg='#1E1E1E')
+        header.pack(side=tk.TOP, fill=tk.X)
+        self.diagnostics_btn = tk.Button(header, text="\u25b8 Diagnostics", command=self.toggle_diagnostics,
+                                        relief=tk.FLAT, bg='#1E1E1E', fg='#FFFFFF', activebackground='#2D2D2D',
+                                        activeforeground='#FFFFFF', font=('Consolas', 10, 'bold'))
+        self.diagnostics_btn.pack(side=tk.LEFT)
+        for text, variable in (("Instrument runs", self.diagnostics_enabled),
+                               ("cProfile", self.profile_enabled)):
+            tk.Checkbutton(header, text=text, variable=variable, bg='#1E1E1E', fg='#FFFFFF',
+                          selectcolor='#2D2D2D', activebackground='#1E1E1E', activeforeground='#FFFFFF',
+                          font=('Consolas', 9)).pack(side=tk.LEFT, padx=(10, 0))
+        for text, command in (("Save pstats...", self.save_pstats),
+                              ("Save Chrome trace...", self.save_chrome_trace)):
+            tk.Button(header, text=text, command=command, bg='#2D2D2D', fg='#FFFFFF',
+                     activebackground='#3D3D3D', activeforeground='#FFFFFF',
+                     font=('Consolas', 8)).pack(side=tk.RIGHT, padx=(5, 0))
+
+        # Per-phase timings, canvas item counts and memory; hidden until opened
+        self.diagnostics_text = tk.Text(diag_frame, height=10, state=tk.DISABLED,
+                                       bg='#2D2D2D', fg='#FFFFFF', font=('Consolas', 9))
+
+    def toggle_diagnostics(self):
+        self.diagnostics_open = not self.diagnostics_open
+        if self.diagnostics_open:
+            self.diagnostics_btn.config(text="\u25be Diagnostics")
+            self.diagnostics_text.pack(side=tk.TOP, fill=tk.BOTH, expand=True, pady=(5, 0))
+            self.show_diagnostics()
+        else:
+            self.diagnostics_btn.config(text="\u25b8 Diagnostics")
+            self.diagnostics_text.pack_forget()
+
+    def start_instrument(self, engine):
+        # Time the engine on the worker thread and each playback phase on the
+        # Tk thread; every run_simulation_step call closes one frame
+        self.instrument = Instrument(self.diagnostic_gauges, self.on_diagnostic_frame,
+                                     profile=self.profile_enabled.get())
+        self.instrument.wrap(engine, 'step')
+        self.instrument.wrap(self, 'replay_slices', 'log_timeline', 'flush_timeline', 'draw_process_blocks',
+                             'update_time_usage', 'redraw_time_usage', 'update_stats', 'finish_simulation')
+        self.instrument.wrap_frame(self, 'run_simulation_step')
+        self.instrument.attach()
+
+    def stop_instrument(self):
+        # The last run's samples are kept for the panel and the save buttons
+        if self.instrument:
+            self.instrument.detach()
+            self.show_diagnostics()
+
+    def diagnostic_gauges(self):
+        gauges = {
+            'block_canvas_items': len(self.canvas.find_all()),
+            'usage_canvas_items': len(self.time_canvas.find_all()),
+            'log_buffer_lines': len(self.log_buffer),
+            'engine_lead_slices': self.slices_ready - self.replay_index,
+        }
+        memory = memory_usage()
+        if memory is not None:
+            gauges['rss_bytes'] = memory
+        return gauges
+
+    def on_diagnostic_frame(self, sample):
+        if not self.simulation_running or sample.index % self.diagnostics_refresh_frames == 0:
+            self.show_diagnostics()
+
+    def show_diagnostics(self):
+        if not self.diagnostics_open:
+            return
+        if self.instrument:
+            lines = self.instrument.summary()
+        else:
+            lines = ["Tick 'Instrument runs' and start a simulation to record per-phase timings,",
+                     "canvas item counts and memory use."]
+        self.diagnostics_text.config(state=tk.NORMAL)
+        self.diagnostics_text.delete(1.0, tk.END)
+        self.diagnostics_text.insert(tk.END, "\n".join(lines))
+        self.diagnostics_text.config(state=tk.DISABLED)
+
+    def save_chrome_trace(self):
+        self.save_diagnostics("Save Chrome trace", ".json", [("Chrome trace", "*.json")],
+                              lambda path: self.instrument.write_chrome_trace(path))
+
+    def save_pstats(self):
+        self.save_diagnostics("Save pstats", ".prof", [("pstats files", "*.prof")],
+                              lambda path: self.instrument.write_pstats(path))
+
+    def save_diagnostics(self, title, extension, filetypes, write):
+        if not self.instrument:
+            messagebox.showerror("Diagnostics", "No instrumented run yet: tick 'Instrument runs' first")
+            return
+        path = filedialog.asksaveasfilename(title=title, defaultextension=extension,
+                                            filetypes=filetypes + [("All files", "*.*")])
+        if not path:
+            return
+        try:
+            write(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Diagnostics", f"Could not save: {str(e)}")
+
+    def get_process_color(self, pid):
+        if pid == IDLE:
+            return IDLE_COLOR
+        if pid == OVERHEAD:
+            return OVERHEAD_COLOR
+        return self.pid_colors[pid]
+
+
+    def open_trace(self, path=None):
+        if path is None:
+            patterns = " ".join(f"*{ext}" for ext in FORMATS)
+            path = filedialog.askopenfilename(title="Open trace",
+                                              filetypes=[("Traces", patterns), ("All files", "*.*")])
+            if not path:
+                return
+        try:
+            self.loaded_table = load_workload(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Trace Error", f"Could not load trace: {str(e)}")
+            return
+        self.trace_status.set(f"Trace: {os.path.basename(path)} ({len(self.loaded_table)} processes)")
+
+    def clear_trace(self):
+        self.loaded_table = None
+        self.color_seed = 0
+        self.trace_status.set("")
+
+    def open_generator_window(self):
+        WorkloadGeneratorWindow(self.root, self.use_generated_workload)
+
+    def use_generated_workload(self, table, description, seed):
+        # A generated workload replaces the entries just like a loaded trace
+        self.loaded_table = table
+        self.color_seed = seed
+        self.trace_status.set(f"Generated: {description} ({len(table)} processes)")
+
+    def assign_process_colors(self):
+        colors = palette(self.color_seed)
+        self.pid_colors = [colors[pid % len(colors)] for pid in range(len(self.table))]
+
+    def read_workload(self):
+        # A loaded trace takes precedence over the comma separated entries
+        if self.loaded_table is not None:
+            return self.loaded_table
+        processes = [p.strip() for p in self.process_entry.get().split(',')]
+        bursts = [int(b.strip()) for b in self.burst_entry.get().split(',')]
+        arrivals = [int(a.strip()) for a in self.arrival_entry.get().split(',')]
+        priorities = None
+        if self.priority_entry.get().strip():
+            priorities = [int(p.strip()) for p in self.priority_entry.get().split(',')]
+            if len(priorities) != len(processes):
+                raise ValueError("Priorities count doesn't match process count")
+        if len(arrivals) != len(processes):
+            raise ValueError("Arrival times count doesn't match process count")
+        if len(processes) != len(bursts):
+            raise ValueError("Process count doesn't match burst times count")
+        return ProcessTable(processes, arrivals, bursts, priorities)
+
+    def scheduler_settings(self):
+        # Engine keyword arguments shared by playback and the quantum sweep
+        return {
+            'policy': self.policy_names[self.policy_choice.get()],
+            'cores': int(self.cores.get()),
+            'queues': self.queue_mode.get(),
+            'switch_cost': int(self.switch_cost.get()),
+            'warmup': int(self.warmup.get()),
+        }
 
     def start_simulation(self):
         try:
-            processes = [p.strip() for p in self.process_entry.get().split(',')]
-            bursts = [int(b.strip()) for b in self.burst_entry.get().split(',')]
+            table = self.read_workload()
             quantum = int(self.quantum_entry.get())
-            arrivals = [int(a.strip()) for a in self.arrival_entry.get().split(',')]
-            if len(arrivals) != len(processes):
-                raise ValueError("Arrival times count doesn't match process count")
-
-            
-            if len(processes) != len(bursts):
-                raise ValueError("Process count doesn't match burst times count")
-            if quantum <= 0:
-                raise ValueError("Quantum must be positive")
-                
-        except ValueError as e:
+            engine = make_engine(table, quantum, **self.scheduler_settings())
+        except (ValueError, tk.TclError) as e:
             messagebox.showerror("Input Error", f"Invalid input: {str(e)}")
             return
+        self.begin_playback(engine)
 
-        # Initialize simulation state
-        self.processes = processes
-        self.burst_times = bursts.copy()
-        self.arrival_times = arrivals.copy()
-        self.time_quantum = quantum
-        self.remaining_times = bursts.copy()
-        self.time = 0
-        self.completion_times = [0] * len(processes)
-        self.first_run = set()
-        self.gantt_chart = []
-
-        random.shuffle(self.process_colors)
-        self.process_color_map = {}
-        for idx, process in enumerate(self.processes):
-            self.process_color_map[process] = self.process_colors[idx % len(self.process_colors)]
-        
-        # Reset statistics
-        self.waiting_times = defaultdict(int)
-        self.turnaround_times = defaultdict(int)
-        self.response_times = {}
-        
-        # Clear displays
-        self.timeline_text.config(state=tk.NORMAL)
-        self.timeline_text.delete(1.0, tk.END)
-        self.timeline_text.config(state=tk.DISABLED)
-        self.canvas.delete("all")
-        self.time_canvas.delete("all")
+    def begin_playback(self, engine, position=0):
+        # Play back `engine`, which may be resumed from a checkpoint; the
+        # first `position` slices of its log are shown at once
+        if self.after_id:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.stop_engine()
+        self.stop_instrument()
+        self.engine = engine
+        self.engine_done = False
+        if self.diagnostics_enabled.get():
+            self.start_instrument(engine)
+        self.prepare_views(engine.result, engine.time)
         self.update_stats()
         
-        # Initialize queue based on arrival times
-        self.queue = deque(sorted(
-            [i for i in range(len(processes)) if arrivals[i] == 0],
-            key=lambda x: arrivals[x]
-        ))
-
-        
         # Enable/disable buttons
         self.start_btn.config(state=tk.DISABLED)
         self.pause_btn.config(state=tk.NORMAL, text="Pause")
@@ -239,179 +573,634 @@ class EnhancedRoundRobinSimulator:
         
         # Start the simulation
         self.log_timeline(">>> Simulation started")
-        self.log_timeline(f">>> Time quantum: {quantum}")
-        self.run_simulation_step()
+        self.log_timeline(f">>> Policy: {POLICIES[self.result.policy].label}")
+        self.log_timeline(f">>> Time quantum: {self.time_quantum}")
+        if self.lane_count:
+            self.log_timeline(f">>> Cores: {self.lane_count} ({engine.queues} ready queues)")
+        if engine.switch_cost or engine.warmup:
+            self.log_timeline(f">>> Switch cost: {engine.switch_cost}, warm-up: {engine.warmup}")
+        if position or self.time:
+            gantt = self.result.gantt
+            self.jump_to(position, gantt.ends[position - 1] if position else self.time)
+        self.start_worker()
+        self.start_frames()
+
+    def prepare_views(self, result, time=0):
+        # Point every view at `result` with none of its slices replayed yet
+        # and the clock at `time`; playback and the benchmark both start here
+        self.result = result
+        self.table = result.table
+        self.lane_count = result.cores if result.cores > 1 else 0
+        self.lane_slices = [array('q') for _ in range(self.lane_count)]  # gantt indices per core
+        self.time_quantum = result.time_quantum
+        self.time = time
+        # Processes that finished before the log began, when a checkpoint was
+        # saved without its Gantt log, are complete from the start
+        if time and not len(result.gantt):
+            self.log_completions = array('q', result.completion_times)
+        else:
+            self.log_completions = zeros(len(self.table))
+        self.completion_times = array('q', self.log_completions)
+        self.replay_index = 0
+        self.run_stats = None
+        self.stats_page = 0
 
+        # Arrival log cursor over processes ordered by arrival time
+        self.arrival_order = sorted(range(len(self.table)), key=self.table.arrivals.__getitem__)
+        self.arrival_cursor = 0
 
-    def run_simulation_step(self):
-        if not self.simulation_running:
+        self.assign_process_colors()
+
+        # Clear displays
+        self.clear_timeline()
+        self.clear_block_view()
+        self.usage_target = 0  # makespan, once the engine has finished
+        self.clear_time_usage()
+
+    def start_worker(self):
+        # The worker fills engine.result ahead of playback and reports how
+        # many slices exist; the Tk thread only replays what is reported
+        self.slice_updates = queue.Queue()
+        self.slices_ready = len(self.result.gantt)
+        self.worker_stop = threading.Event()
+        self.worker = threading.Thread(target=self.run_engine,
+                                       args=(self.engine, self.slice_updates, self.worker_stop), daemon=True)
+        self.worker.start()
+
+    def jump_to(self, index, time):
+        # Show the first `index` slices at once, as if they had just been
+        # replayed, with the clock at `time`
+        gantt = self.result.gantt
+        self.replay_index = index
+        self.time = time
+        self.run_stats = None
+        # A process has completed once its last slice is among those shown
+        completion = self.result.completion_times
+        self.completion_times = array('q', self.log_completions)
+        for pid, end in zip(gantt.pids[:index], gantt.ends[:index]):
+            if pid >= 0 and end == completion[pid]:
+                self.completion_times[pid] = end
+        if self.lane_count:
+            self.lane_slices = [array('q') for _ in range(self.lane_count)]
+            for i, core in enumerate(gantt.cores[:index]):
+                self.lane_slices[core].append(i)
+
+        # Arrivals up to the new clock count as already logged
+        arrivals = self.table.arrivals
+        self.arrival_cursor = 0
+        while self.arrival_cursor < len(self.arrival_order) and \
+                arrivals[self.arrival_order[self.arrival_cursor]] <= time:
+            self.arrival_cursor += 1
+
+        self.clear_block_view()
+        if index:
+            self.draw_process_blocks(0)
+            pid, start, end = gantt[index - 1]
+            self.current_process.set(f"{self.table.name(pid)} ({start}-{end})")
+        self.redraw_time_usage()
+        self.update_stats()
+        self.log_timeline(f">>> Jumped to time {time} (slice {index})")
+
+    def seek(self):
+        if self.result is None:
+            return
+        try:
+            target = int(self.seek_entry.get())
+            if target < 0:
+                raise ValueError("seek time must not be negative")
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid input: {str(e)}")
             return
 
-    # Check for new arrivals if using arrival times
-    
-        new_arrivals = [
-            i for i in range(len(self.processes))
-            if self.arrival_times[i] == self.time
-            and i not in self.queue
-            and self.remaining_times[i] > 0
-        ]
-        for new in new_arrivals:
-            self.queue.append(new)
-            self.log_timeline(f">>> Time {self.time}: {self.processes[new]} arrived")
-
-        if not self.queue:
-        # Check if all processes are done
-            if all(t == 0 for t in self.remaining_times):
-                self.finish_simulation()
-                return
+        # Simulate at least up to the target; the worker is stopped so the
+        # Tk thread can step the engine itself
+        if self.engine is not None:
+            self.stop_engine(wait=True)
+            self.engine.step(until=target + 1)
+        gantt = self.result.gantt
+        self.jump_to(gantt.started_by(target), target)
+        if self.engine is not None:
+            self.start_worker()
+        elif not self.simulation_running:
+            # A finished run can be replayed again from the new position
+            self.pause_btn.config(state=tk.NORMAL, text="Resume")
+
+    def save_checkpoint(self):
+        if self.engine is None:
+            messagebox.showerror("Checkpoint Error", "There is no unfinished simulation to checkpoint")
+            return
+        path = filedialog.asksaveasfilename(title="Save checkpoint", defaultextension=".rrc",
+                                            filetypes=[("Checkpoints", "*.rrc"), ("All files", "*.*")])
+        if not path:
+            return
+
+        # The worker must be idle while the engine's state is written
+        self.stop_engine(wait=True)
+        try:
+            save_checkpoint(self.engine, path, extra={'position': self.replay_index, 'color_seed': self.color_seed})
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Checkpoint Error", f"Could not save checkpoint: {str(e)}")
+        else:
+            self.log_timeline(f">>> Checkpoint saved at time {self.time}: {os.path.basename(path)}")
+        self.start_worker()
+
+    def export_results(self, kind):
+        # Gantt slices (as a table or a chart) or per-process statistics of
+        # the finished run; the format follows the file extension
+        if self.run_stats is None:
+            messagebox.showerror("Export Error", "Finish a simulation before exporting its results")
+            return
+        allowed = EXPORT_FORMATS.values() if kind == 'gantt' else TABLE_FORMATS
+        patterns = " ".join(f"*{ext}" for ext, fmt in EXPORT_FORMATS.items() if fmt in allowed)
+        path = filedialog.asksaveasfilename(title="Export " + ("Gantt" if kind == 'gantt' else "statistics"),
+                                            defaultextension=".csv",
+                                            filetypes=[("Exports", patterns), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            if kind == 'gantt':
+                export_gantt(self.result, path, seed=self.color_seed)
             else:
-                self.time += 1
-                self.after_id = self.root.after(self.speed.get(), self.run_simulation_step)
+                export_processes(self.result, path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Export Error", f"Could not export: {str(e)}")
+            return
+        self.log_timeline(f">>> Exported {kind} to {os.path.basename(path)}")
+
+    def open_checkpoint(self, path=None):
+        if path is None:
+            path = filedialog.askopenfilename(title="Open checkpoint",
+                                              filetypes=[("Checkpoints", "*.rrc"), ("All files", "*.*")])
+            if not path:
+                return
+        try:
+            engine, extra = load_checkpoint(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Checkpoint Error", f"Could not load checkpoint: {str(e)}")
+            return
+
+        # A checkpoint saved without its Gantt log records slices from here on
+        engine.record = True
+        self.loaded_table = engine.result.table
+        self.color_seed = extra.get('color_seed', 0)
+        self.trace_status.set(f"Checkpoint: {os.path.basename(path)} "
+                              f"(time {engine.time}, {len(self.loaded_table)} processes)")
+        self.begin_playback(engine, min(extra.get('position', 0), len(engine.result.gantt)))
+
+    def open_sweep_window(self):
+        try:
+            table = self.read_workload()
+            settings = self.scheduler_settings()
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Input Error", f"Invalid input: {str(e)}")
+            return
+        QuantumSweepWindow(self.root, table, settings)
+
+    def log_arrivals(self, until):
+        # Log every process that has arrived by `until` and was not logged yet
+        arrivals = self.table.arrivals
+        while self.arrival_cursor < len(self.arrival_order):
+            pid = self.arrival_order[self.arrival_cursor]
+            if arrivals[pid] > until:
+                break
+            self.log_timeline(f">>> Time {arrivals[pid]}: {self.table.names[pid]} arrived", verbose=True)
+            self.arrival_cursor += 1
+
+    def run_engine(self, engine, updates, stop):
+        # Worker thread: simulate in chunks, staying a bounded distance ahead
+        # of playback, and post (slices available, finished) after each chunk
+        gantt = engine.result.gantt
+        while not stop.is_set():
+            if len(gantt) - self.replay_index > self.engine_lookahead:
+                stop.wait(0.05)
+                continue
+            engine.step(self.engine_chunk)
+            updates.put((len(gantt), engine.done))
+            if engine.done:
                 return
 
-        process_idx = self.queue.popleft()
-        process_name = self.processes[process_idx]
-        remaining = self.remaining_times[process_idx]
-
-    # Track first run for response time
-        if process_name not in self.response_times:
-            self.response_times[process_name] = self.time
-
-    # Determine execution duration
-        exec_time = min(self.time_quantum, remaining)
-        start_time = self.time
-        end_time = start_time + exec_time
-
-    # Update timeline
-        self.log_timeline(f">>> Time {start_time}-{end_time}: {process_name} executes for {exec_time} units")
-        self.current_process.set(f"{process_name} ({start_time}-{end_time})")
-
-    # Draw process block
-        self.draw_process_block(process_name, start_time, end_time, process_idx)
-
-    # Record for time usage visualization
-        self.gantt_chart.append((process_name, start_time, end_time))
-
-    # Update process state
-        self.remaining_times[process_idx] -= exec_time
-        self.time = end_time
-
-    # Update waiting times only for processes in queue
-        for idx in list(self.queue):
-           if self.remaining_times[idx] > 0 and self.arrival_times[idx] <= self.time:
-                self.waiting_times[self.processes[idx]] += exec_time
-
-    # Check for new arrivals after execution
-        new_arrivals = [
-            i for i in range(len(self.processes))
-            if self.arrival_times[i] > start_time and self.arrival_times[i] <= self.time
-            and i not in self.queue
-            and self.remaining_times[i] > 0
-            ]
-        for new in new_arrivals:
-            self.queue.append(new)
-            self.log_timeline(f">>> Time {self.time}: {self.processes[new]} arrived")
-
-
-    # Requeue if not finished
-        if self.remaining_times[process_idx] > 0:
-            self.queue.append(process_idx)
-            status = "requeued"
+    def stop_engine(self, wait=False):
+        if self.worker_stop:
+            self.worker_stop.set()
+            if wait:
+                self.worker.join()
+        self.worker_stop = None
+
+    def start_frames(self):
+        self.frame_budget = 0.0  # slices due but not yet shown
+        self.last_frame = time.perf_counter()
+        self.run_simulation_step()
+
+    def run_simulation_step(self):
+        # One frame: show the slices due since the last frame, then reschedule
+        if not self.simulation_running:
+            return
+
+        try:
+            while True:
+                self.slices_ready, self.engine_done = self.slice_updates.get_nowait()
+        except queue.Empty:
+            pass
+        if self.engine_done:
+            self.usage_target = self.result.makespan
+
+        now = time.perf_counter()
+        if self.instant.get():
+            due = self.max_slices_per_frame
         else:
-            self.completion_times[process_idx] = self.time
-            status = "completed"
+            self.frame_budget += (now - self.last_frame) * self.slices_per_second()
+            due = int(self.frame_budget)
+        self.last_frame = now
+
+        count = min(due, self.slices_ready - self.replay_index, self.max_slices_per_frame)
+        if count > 0:
+            self.replay_slices(count)
+        # Don't bank time spent waiting on the engine or beyond the frame cap
+        self.frame_budget = min(self.frame_budget - max(count, 0), 1.0)
+
+        if self.engine_done and self.replay_index >= self.slices_ready:
+            self.finish_simulation()
+            return
+        self.after_id = self.root.after(self.frame_ms, self.run_simulation_step)
+
+    def replay_slices(self, count):
+        first = self.replay_index
+        gantt = self.result.gantt
+        completion = self.result.completion_times
+        lanes = self.lane_count
+        where = ""
+
+        for index in range(first, first + count):
+            process_idx, start_time, end_time = gantt[index]
+            process_name = self.table.name(process_idx)
+            if lanes:
+                core = gantt.cores[index]
+                self.lane_slices[core].append(index)
+                where = f" on CPU {core}"
+
+            self.log_arrivals(start_time)
+            if process_idx == IDLE:
+                self.log_timeline(f">>> Time {start_time}-{end_time}: CPU idle", verbose=True)
+            elif process_idx == OVERHEAD:
+                self.log_timeline(f">>> Time {start_time}-{end_time}: context switch{where}", verbose=True)
+            else:
+                self.log_timeline(f">>> Time {start_time}-{end_time}: {process_name} executes{where} for "
+                                  f"{end_time - start_time} units", verbose=True)
+            self.replay_index = index + 1
+            self.time = end_time
+            if not lanes:
+                # Other cores' slices that start before end_time are still to come
+                self.log_arrivals(end_time)
+
+            if process_idx < 0:
+                continue
+            if end_time == completion[process_idx]:
+                self.completion_times[process_idx] = end_time
+                status = "completed"
+            else:
+                status = "requeued"
+            self.log_timeline(f">>> Time {end_time}: {process_name} {status}", verbose=True)
 
-        self.log_timeline(f">>> Time {end_time}: {process_name} {status}")
+        self.current_process.set(f"{process_name} ({start_time}-{end_time}){where}")
 
-    # Update time usage visualization
-        self.update_time_usage()
+        # Block view and time usage are updated once per frame
+        self.draw_process_blocks(first)
+        self.update_time_usage(first)
 
-    # Schedule next step
-        self.after_id = self.root.after(self.speed.get(), self.run_simulation_step)
+    def clear_block_view(self):
+        self.canvas.delete("all")
+        self.block_items = []  # pooled (rect, name, span) item ids, one per visible slot
+        self.block_first = 0  # slot shown by the first pooled items
+        self.block_count = 0  # number of slots currently in use
+        self.row_slots = self.lane_slots if self.lane_count else self.blocks_per_row
+        self.block_left = self.x_offset + (self.lane_label_width if self.lane_count else 0)
+
+        # Each core's lane shows its newest slices, with the CPU name on the left
+        for core in range(self.lane_count):
+            self.canvas.create_text(self.x_offset, self.y_offset + core * self.row_height + self.block_height / 2,
+                                    text=f"CPU {core}", anchor='w', fill='#FFFFFF', font=('Consolas', 9))
+        rows = self.lane_count
+        self.canvas.config(scrollregion=(0, 0, self.max_row_width, self.y_offset + rows * self.row_height))
+        self.canvas.yview_moveto(0)
+
+    def scroll_blocks(self, *args):
+        self.canvas.yview(*args)
+        self.refresh_block_view()
+
+    def visible_block_range(self):
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(0, int((top - self.y_offset) // self.row_height))
+        last_row = max(first_row, int((bottom - self.y_offset) // self.row_height))
+        return first_row * self.row_slots, (last_row - first_row + 1) * self.row_slots
+
+    def slice_at(self, slot):
+        # Gantt index shown in a grid slot, or -1 for an empty slot
+        if not self.lane_count:
+            return slot if slot < self.replay_index else -1
+        lane, column = divmod(slot, self.row_slots)
+        if lane >= self.lane_count:
+            return -1
+        slices = self.lane_slices[lane]
+        column += max(0, len(slices) - self.row_slots)
+        return slices[column] if column < len(slices) else -1
+
+    def refresh_block_view(self):
+        first, count = self.visible_block_range()
+        while len(self.block_items) < count:
+            self.block_items.append((
+                self.canvas.create_rectangle(0, 0, 0, 0, outline='#333333', width=1, state='hidden'),
+                self.canvas.create_text(0, 0, fill='black', font=('Consolas', 9, 'bold'), state='hidden'),
+                self.canvas.create_text(0, 0, fill='black', font=('Consolas', 7), state='hidden'),
+            ))
+
+        self.block_first, self.block_count = first, count
+        for i, items in enumerate(self.block_items):
+            index = self.slice_at(first + i) if i < count else -1
+            if index >= 0:
+                self.bind_block(items, first + i, index)
+            else:
+                for item in items:
+                    self.canvas.itemconfigure(item, state='hidden')
 
-    
-    def draw_process_block(self, process, start, end, process_idx):
-        color = self.get_process_color(process)
+    def bind_block(self, items, slot, index):
+        # Point the pooled items of a grid slot at the stored slice `index`
+        pid, start, end = self.result.gantt[index]
+        rect, name_text, span_text = items
 
-        
-        # Check if we need new row
-        if self.x_offset + self.block_width > self.max_row_width:
-            self.x_offset = 20
-            self.y_offset += self.block_height + 10
-            self.current_row += 1
-        
-        # Draw the block
-        x1, y1 = self.x_offset, self.y_offset
+        x1 = self.block_left + (slot % self.row_slots) * (self.block_width + self.block_gap)
+        y1 = self.y_offset + (slot // self.row_slots) * self.row_height
         x2, y2 = x1 + self.block_width, y1 + self.block_height
-        
-        # Create block with outline
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='#333333', width=1)
-        self.canvas.create_text((x1+x2)/2, (y1+y2)/2, text=process, fill='black', 
-                               font=('Consolas', 9, 'bold'))
-        self.canvas.create_text((x1+x2)/2, y2-10, text=f"{start}-{end}", fill='black',
-                              font=('Consolas', 7))
-        
-        self.x_offset += self.block_width + self.block_gap
 
-    def update_time_usage(self):
-        self.time_canvas.delete("all")
-        
-        if not self.gantt_chart:
+        self.canvas.coords(rect, x1, y1, x2, y2)
+        self.canvas.itemconfigure(rect, fill=self.get_process_color(pid), state='normal')
+        self.canvas.coords(name_text, (x1+x2)/2, (y1+y2)/2)
+        self.canvas.itemconfigure(name_text, text=self.table.name(pid), state='normal')
+        self.canvas.coords(span_text, (x1+x2)/2, y2-10)
+        self.canvas.itemconfigure(span_text, text=f"{start}-{end}", state='normal')
+
+    def draw_process_blocks(self, first):
+        # Slices first..replay_index-1 were just added to the shown entries
+        if self.lane_count:
+            # Lanes are fixed; every visible lane may have shifted left
+            self.refresh_block_view()
             return
-            
-        # Calculate total time
-        total_time = max(end for _, _, end in self.gantt_chart)
-        if total_time == 0:
+        rows = (self.replay_index - 1) // self.blocks_per_row + 1
+
+        # Follow the newest block only while the view is scrolled to the bottom
+        at_bottom = self.canvas.yview()[1] >= 1.0
+        self.canvas.config(scrollregion=(0, 0, self.max_row_width,
+                                         self.y_offset + rows * self.row_height))
+        if at_bottom:
+            self.canvas.yview_moveto(1.0)
+
+        if self.visible_block_range() != (self.block_first, self.block_count):
+            self.refresh_block_view()
             return
-            
-        # Calculate scale
-        canvas_width = self.time_canvas.winfo_width() - 40
-        scale = canvas_width / total_time if total_time > 0 else 1
-        
+        for index in range(max(first, self.block_first),
+                           min(self.replay_index, self.block_first + self.block_count)):
+            self.bind_block(self.block_items[index - self.block_first], index, index)
+
+    def clear_time_usage(self):
+        self.time_canvas.delete("all")
+        self.usage_span = 0  # time units covered by the axis
+        self.usage_scale = 1  # pixels per time unit
+        self.usage_rows = {}  # pid -> bar row
+        # pid, or core in lanes, -> (rect id, text id, bar start, bar end, pid, color, y) of its last bar
+        self.usage_tail = {}
+        self.usage_stretched = set()  # keys whose last bar grew since the canvas was updated
+        self.usage_dropped = set()  # keys with slices dropped after their last bar
+        self.usage_left = 20  # x of time 0
+        self.usage_pitch = 25  # row spacing
+        self.usage_bar_height = 20
+        # Rows per core; a single CPU gets one row per process unless there
+        # are too many to show, as in exported charts
+        self.usage_lanes = self.lane_count or (1 if len(self.table) > MAX_PROCESS_ROWS else 0)
+
+        if self.usage_lanes:
+            # One fixed row per core, squeezed to fit the canvas
+            height = max(self.time_canvas.winfo_height(), 250)
+            self.usage_left = 70
+            self.usage_pitch = max(2, min(25, (height - 70) // self.usage_lanes))
+            self.usage_bar_height = max(1, self.usage_pitch - (5 if self.usage_pitch >= 10 else 1))
+            if self.usage_pitch >= 10:
+                for core in range(self.usage_lanes):
+                    self.time_canvas.create_text(20, 60 + core * self.usage_pitch + self.usage_bar_height / 2,
+                                                 text=f"CPU {core}", anchor='w', fill='#FFFFFF',
+                                                 font=('Consolas', 8))
+
+    def on_time_canvas_resize(self, event):
+        if self.resize_after_id:
+            self.root.after_cancel(self.resize_after_id)
+        self.resize_after_id = self.root.after(100, self.redraw_time_usage)
+
+    def redraw_time_usage(self):
+        self.clear_time_usage()
+        if not self.replay_index:
+            return
+        gantt = self.result.gantt
+        self.rescale_time_usage(max(gantt.ends[:self.replay_index]))
+        for i in range(self.replay_index):
+            self.draw_usage_bar(gantt.pids[i], gantt.starts[i], gantt.ends[i],
+                                gantt.cores[i] if self.lane_count else None)
+        self.stretch_usage_bars()
+
+    def update_time_usage(self, first):
+        # Incrementally add only the slices shown since `first`
+        gantt = self.result.gantt
+        end = max(gantt.ends[first:self.replay_index])
+        if end > self.usage_span:
+            self.rescale_time_usage(end)
+        for i in range(first, self.replay_index):
+            self.draw_usage_bar(gantt.pids[i], gantt.starts[i], gantt.ends[i],
+                                gantt.cores[i] if self.lane_count else None)
+        self.stretch_usage_bars()
+
+    def rescale_time_usage(self, end):
+        # Size the axis for the final makespan when known, otherwise double it
+        # so a growing run rescales O(log makespan) times
+        if self.usage_span:
+            span = max(end, self.usage_span * 2)
+        else:
+            span = max(end, self.usage_target)
+        canvas_width = max(self.time_canvas.winfo_width() - self.usage_left - 20, 1)
+        scale = canvas_width / span
+
+        if self.usage_span:
+            self.time_canvas.scale("bar", self.usage_left, 0, scale / self.usage_scale, 1)
+        self.usage_span = span
+        self.usage_scale = scale
+
         # Draw time scale
-        self.time_canvas.create_line(20, 30, 20 + canvas_width, 30, fill='#FFFFFF', width=2)
-        for t in range(0, total_time + 1, max(1, total_time // 10)):
-            x = 20 + t * scale
-            self.time_canvas.create_line(x, 25, x, 35, fill='#FFFFFF')
-            self.time_canvas.create_text(x, 45, text=str(t), fill='#FFFFFF', font=('Consolas', 8))
-        
-        # Draw process bars
+        self.time_canvas.delete("axis")
+        left = self.usage_left
+        self.time_canvas.create_line(left, 30, left + canvas_width, 30, fill='#FFFFFF', width=2, tags="axis")
+        for t in range(0, span + 1, max(1, span // 10)):
+            x = left + t * scale
+            self.time_canvas.create_line(x, 25, x, 35, fill='#FFFFFF', tags="axis")
+            self.time_canvas.create_text(x, 45, text=str(t), fill='#FFFFFF', font=('Consolas', 8), tags="axis")
+
+    def draw_usage_bar(self, pid, start, end, core=None):
+        # One row per process, or per core when the run has lanes
         y_start = 60
-        bar_height = 20
-        process_rows = {}
-        current_row = 0
-        
-        for process, start, end in self.gantt_chart:
-            if process not in process_rows:
-                process_rows[process] = current_row
-                current_row += 1
-                
-            y = y_start + process_rows[process] * (bar_height + 5)
-            x1 = 20 + start * scale
-            x2 = 20 + end * scale
-            
-            color = self.get_process_color(process)
-
-            self.time_canvas.create_rectangle(x1, y, x2, y + bar_height, fill=color, outline='#333333')
-            self.time_canvas.create_text((x1+x2)/2, y + bar_height/2, text=process, 
-                                        fill='black', font=('Consolas', 8))
-        
-        # Draw legend
-        legend_y = y_start + len(process_rows) * (bar_height + 5) + 20
-        for i, process in enumerate(process_rows.keys()):
-            color = self.get_process_color(process)
+        bar_height = self.usage_bar_height
+        pitch = self.usage_pitch
+        left = self.usage_left
+        scale = self.usage_scale
+
+        if not self.usage_lanes:
+            key = pid
+            if pid not in self.usage_rows:
+                row = len(self.usage_rows)
+                self.usage_rows[pid] = row
+                self.draw_legend_entry(pid, row)
+            y = y_start + self.usage_rows[pid] * pitch
+        else:
+            key = core = core or 0
+            y = y_start + core * pitch
+        color = self.get_process_color(pid)
+
+        # Like rr_export.GanttChart.spans: a slice within a pixel of the
+        # row's last bar extends that bar when the colors match and nothing
+        # was dropped in between, and is otherwise clipped to the pixels
+        # the bar leaves free, or dropped when less than one is left. A row
+        # then holds at most about one bar per pixel however long the run
+        # is, and a stretched bar is only resized once per batch
+        # (stretch_usage_bars).
+        tail = self.usage_tail.get(key)
+        if tail and (start - tail[3]) * scale < 1:
+            rect, label, bar_start, bar_end, bar_pid, bar_color = tail[:6]
+            if color == bar_color and key not in self.usage_dropped:
+                if label and pid != bar_pid:
+                    self.time_canvas.delete(label)
+                    label = None
+                self.usage_tail[key] = (rect, label, bar_start, max(end, bar_end), pid, color, y)
+                self.usage_stretched.add(key)
+                return
+            if (end - bar_end) * scale < 1:
+                self.usage_dropped.add(key)
+                return
+            start = bar_end
+        self.usage_dropped.discard(key)
+
+        x1 = left + start * scale
+        x2 = left + end * scale
+        rect = self.time_canvas.create_rectangle(x1, y, x2, y + bar_height, fill=color,
+                                                 outline='#333333' if bar_height >= 4 else '', tags="bar")
+        label = None
+        if bar_height >= 10:
+            label = self.time_canvas.create_text((x1+x2)/2, y + bar_height/2, text=self.table.name(pid),
+                                                 fill='black', font=('Consolas', 8), tags="bar")
+        self.usage_tail[key] = (rect, label, start, end, pid, color, y)
+
+    def stretch_usage_bars(self):
+        # Resize the bars that absorbed slices in the last batch
+        left = self.usage_left
+        scale = self.usage_scale
+        bar_height = self.usage_bar_height
+        for key in self.usage_stretched:
+            rect, label, bar_start, bar_end, _, _, y = self.usage_tail[key]
+            x1 = left + bar_start * scale
+            x2 = left + bar_end * scale
+            self.time_canvas.coords(rect, x1, y, x2, y + bar_height)
+            if label:
+                self.time_canvas.coords(label, (x1 + x2) / 2, y + bar_height / 2)
+        self.usage_stretched.clear()
+
+    def draw_legend_entry(self, pid, i):
+        # The legend sits below room for every process row (plus idle and
+        # overhead) and wraps to the canvas width, so new entries never move
+        # earlier ones
+        color = self.get_process_color(pid)
+        per_line = max(1, (self.time_canvas.winfo_width() - 20) // 120)
+        x = 20 + i % per_line * 120
+        legend_y = 60 + (len(self.table) + 2) * self.usage_pitch + 20 + i // per_line * 25
+
+        self.time_canvas.create_rectangle(x, legend_y, x + 20, legend_y + 20,
+                                        fill=color, outline='#333333', tags="legend")
+        self.time_canvas.create_text(x + 30, legend_y + 10, text=self.table.name(pid),
+                                   fill='#FFFFFF', font=('Consolas', 8), anchor='w', tags="legend")
+
+    def log_timeline(self, message, verbose=False):
+        # Per-slice messages are dropped unless verbose logging is on
+        if verbose and not self.log_verbose.get():
+            return
+        self.log_buffer.append(message + "\n")
+        if self.log_flush_id is None:
+            self.log_flush_id = self.root.after(16, self.flush_timeline)
 
-            self.time_canvas.create_rectangle(20 + i * 120, legend_y, 20 + i * 120 + 20, legend_y + 20, 
-                                            fill=color, outline='#333333')
-            self.time_canvas.create_text(20 + i * 120 + 30, legend_y + 10, text=process, 
-                                       fill='#FFFFFF', font=('Consolas', 8), anchor='w')
+    def flush_timeline(self):
+        self.log_flush_id = None
+        if not self.log_buffer:
+            return
 
-    def log_timeline(self, message):
+        # Keep the widget a bounded ring buffer of the newest lines. A frame
+        # can log more lines than the widget keeps; those, and everything
+        # the widget held, go straight to the log file without ever being
+        # inserted.
+        try:
+            max_lines = max(1, self.log_max_lines.get())
+        except tk.TclError:
+            max_lines = 1000
+        buffer = self.log_buffer
+        self.log_buffer = []
         self.timeline_text.config(state=tk.NORMAL)
-        self.timeline_text.insert(tk.END, message + "\n")
+        if len(buffer) >= max_lines:
+            if self.log_file:
+                self.spill_timeline(self.timeline_text.get(1.0, 'end-1c') + "".join(buffer[:-max_lines]))
+            self.timeline_text.delete(1.0, tk.END)
+            buffer = buffer[-max_lines:]
+        self.timeline_text.insert(tk.END, "".join(buffer))
+
+        lines = int(self.timeline_text.index('end-1c').split('.')[0]) - 1
+        if lines > max_lines:
+            cut = f"{lines - max_lines + 1}.0"
+            self.spill_timeline(self.timeline_text.get(1.0, cut))
+            self.timeline_text.delete(1.0, cut)
+
         self.timeline_text.see(tk.END)
         self.timeline_text.config(state=tk.DISABLED)
 
+    def spill_timeline(self, text):
+        if self.log_file:
+            self.log_file.write(text)
+            self.log_file.flush()
+
+    def clear_timeline(self):
+        if self.log_flush_id:
+            self.root.after_cancel(self.log_flush_id)
+            self.log_flush_id = None
+        if self.log_file:
+            self.spill_timeline(self.timeline_text.get(1.0, 'end-1c') + "".join(self.log_buffer))
+        self.log_buffer = []
+
+        self.timeline_text.config(state=tk.NORMAL)
+        self.timeline_text.delete(1.0, tk.END)
+        self.timeline_text.config(state=tk.DISABLED)
+
+    def choose_log_file(self):
+        path = filedialog.asksaveasfilename(title="Spill timeline to", defaultextension=".log",
+                                            filetypes=[("Log files", "*.log"), ("All files", "*.*")])
+        if not path:
+            return
+        if self.log_file:
+            self.log_file.close()
+        self.log_file = open(path, 'a', encoding='utf-8')
+        self.log_file_btn.config(text=f"Log: {os.path.basename(path)}")
+
+    def close_log_file(self):
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
+            self.log_file_btn.config(text="Log to file...")
+
+    def exit(self):
+        # Spill what the timeline still shows before the log file is closed
+        self.stop_engine()
+        self.clear_timeline()
+        self.close_log_file()
+        self.root.destroy()
+
     def toggle_pause(self):
         if self.simulation_running:
             self.simulation_running = False
@@ -423,69 +1212,96 @@ class EnhancedRoundRobinSimulator:
             self.simulation_running = True
             self.pause_btn.config(text="Pause")
             self.log_timeline(">>> Simulation resumed")
-            self.run_simulation_step()
+            self.start_frames()
 
     def finish_simulation(self):
         self.simulation_running = False
+        self.engine = None
+        self.worker_stop = None
         self.current_process.set("Simulation Complete")
         self.start_btn.config(state=tk.NORMAL)
         self.pause_btn.config(state=tk.DISABLED)
         
-        # Calculate final statistics
-        for i, name in enumerate(self.processes):
-           self.turnaround_times[name] = self.completion_times[i] - self.arrival_times[i]
-        
         self.log_timeline(">>> Simulation completed")
+        self.run_stats = compute_stats(self.result)
         self.update_stats()
-        self.update_time_usage()
+        self.stop_instrument()
 
     def update_stats(self):
         stats = ["Process Statistics:\n"]
         stats.append(f"{'Process':<10}{'Arrival':<10}{'Burst':<8}{'Completion':<12}{'Turnaround':<12}{'Waiting':<8}")
         stats.append("-"*60)
 
-        total_tt = 0
-        total_wt = 0
-
-        for i, name in enumerate(self.processes):
-            arrival = self.arrival_times[i]
-
-            burst = self.burst_times[i]
-            completion = self.completion_times[i]
+        # Only the rows of the current page are formatted
+        table = self.table
+        pages = max(1, -(-len(table) // self.stats_page_size))
+        self.stats_page = min(self.stats_page, pages - 1)
+        first = self.stats_page * self.stats_page_size
+        last = min(len(table), first + self.stats_page_size)
+
+        for pid in range(first, last):
+            name = table.names[pid]
+            arrival = table.arrivals[pid]
+            burst = table.bursts[pid]
+            completion = self.completion_times[pid]
             turnaround = completion - arrival
             waiting = turnaround - burst
-        
-            total_tt += turnaround
-            total_wt += waiting
 
             stats.append(f"{name:<10}{arrival:<10}{burst:<8}{completion:<12}{turnaround:<12}{waiting:<8}")
 
-        if self.processes:
-            avg_tt = total_tt / len(self.processes)
-            avg_wt = total_wt / len(self.processes)
-            stats.append("\nAverage Turnaround Time: {:.2f}".format(avg_tt))
-            stats.append("Average Waiting Time: {:.2f}".format(avg_wt))
-
+        if self.run_stats:
+            stats.append("")
+            stats.extend(self.run_stats.summary())
+            if self.run_stats.cores > 1:
+                stats.append("")
+                stats.append(f"{'Core':<10}{'Busy':<12}{'Switches':<12}{'Utilization':<12}")
+                for core, busy in enumerate(self.result.core_busy):
+                    utilization = self.run_stats.core_utilization[core] * 100
+                    switches = self.result.core_switches[core]
+                    stats.append(f"{'CPU ' + str(core):<10}{busy:<12}{switches:<12}{utilization:.1f}%")
+
+        self.stats_page_label.config(text=f"Page {self.stats_page + 1}/{pages}")
         self.stats_text.config(state=tk.NORMAL)
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.insert(tk.END, "\n".join(stats))
         self.stats_text.config(state=tk.DISABLED)
 
+    def turn_stats_page(self, delta):
+        self.stats_page = max(0, self.stats_page + delta)
+        self.update_stats()
+
 
     def reset_simulation(self):
         if self.after_id:
             self.root.after_cancel(self.after_id)
+        self.stop_engine()
+        self.stop_instrument()
+        self.engine = None
         
         self.simulation_running = False
         self.current_process.set("Ready")
+
+        # Drop the run itself, so Seek and Resume have nothing to go back to
+        self.result = None
+        self.table = ProcessTable()
+        self.completion_times = zeros(0)
+        self.slice_updates = queue.Queue()
+        self.slices_ready = 0
+        self.engine_done = False
         
-        # Clear all displays
-        self.timeline_text.config(state=tk.NORMAL)
-        self.timeline_text.delete(1.0, tk.END)
-        self.timeline_text.config(state=tk.DISABLED)
+        # Clear all displays; the timeline is spilled to the log file, which
+        # is then closed
+        self.clear_timeline()
+        self.close_log_file()
         
-        self.canvas.delete("all")
-        self.time_canvas.delete("all")
+        self.replay_index = 0
+        self.lane_count = 0
+        self.run_stats = None
+        self.stats_page = 0
+        self.stats_page_label.config(text="Page 1/1")
+        self.clear_block_view()
+        self.usage_target = 0
+        self.clear_time_usage()
         self.stats_text.config(state=tk.NORMAL)
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.config(state=tk.DISABLED)
@@ -493,13 +1309,207 @@ class EnhancedRoundRobinSimulator:
         # Reset buttons
         self.start_btn.config(state=tk.NORMAL)
         self.pause_btn.config(state=tk.DISABLED, text="Pause")
-        
-        # Reset visualization parameters
-        self.x_offset = 20
-        self.y_offset = 50
-        self.current_row = 0
+
+class WorkloadGeneratorWindow:
+    # Builds a seeded synthetic workload and hands it to `on_generate`
+    def __init__(self, root, on_generate):
+        self.on_generate = on_generate
+        self.window = tk.Toplevel(root)
+        self.window.title("Generate Workload")
+        self.window.configure(bg='#1E1E1E', padx=10, pady=10)
+
+        self.fields = {}
+        for row, (label, key, default) in enumerate([
+            ("Processes:", 'count', "1000"),
+            ("Mean burst:", 'mean_burst', "10"),
+            ("Load:", 'load', "0.9"),
+            ("Priority levels:", 'priority_levels', "4"),
+            ("Seed:", 'seed', "1"),
+        ]):
+            tk.Label(self.window, text=label, bg='#1E1E1E', fg='#FFFFFF',
+                    font=('Consolas', 9)).grid(row=row, column=0, sticky='w')
+            entry = tk.Entry(self.window, width=20, bg='#2D2D2D', fg='#FFFFFF',
+                            insertbackground='white', font=('Consolas', 9))
+            entry.insert(0, default)
+            entry.grid(row=row, column=1, padx=5, pady=3)
+            self.fields[key] = entry
+
+        self.choices = {}
+        for row, (label, key, values) in enumerate([
+            ("Arrivals:", 'arrivals', ARRIVAL_MODELS),
+            ("Bursts:", 'bursts', BURST_MODELS),
+        ], start=len(self.fields)):
+            tk.Label(self.window, text=label, bg='#1E1E1E', fg='#FFFFFF',
+                    font=('Consolas', 9)).grid(row=row, column=0, sticky='w')
+            choice = ttk.Combobox(self.window, width=18, state='readonly', values=values, font=('Consolas', 9))
+            choice.set(values[0])
+            choice.grid(row=row, column=1, padx=5, pady=3)
+            self.choices[key] = choice
+
+        tk.Button(self.window, text="Generate", command=self.generate,
+                 bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                 activeforeground='#FFFFFF', font=('Consolas', 9, 'bold')).grid(
+                     row=len(self.fields) + len(self.choices), column=0, columnspan=2, pady=(8, 0))
+
+    def generate(self):
+        try:
+            count = int(self.fields['count'].get())
+            seed = int(self.fields['seed'].get())
+            arrivals = self.choices['arrivals'].get()
+            bursts = self.choices['bursts'].get()
+            table = generate(count, arrivals, bursts,
+                             mean_burst=float(self.fields['mean_burst'].get()),
+                             load=float(self.fields['load'].get()),
+                             priority_levels=int(self.fields['priority_levels'].get()),
+                             seed=seed)
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid input: {str(e)}", parent=self.window)
+            return
+        self.on_generate(table, f"{arrivals}/{bursts}, seed {seed}", seed)
+        self.window.destroy()
+
+
+class QuantumSweepWindow:
+    # Runs a quantum sweep off the Tk thread and plots the metrics per quantum
+    series = [
+        ('avg_waiting', 'Avg waiting', '#e6194b'),
+        ('p95_waiting', 'p95 waiting', '#ffe119'),
+        ('avg_turnaround', 'Avg turnaround', '#3cb44b'),
+        ('avg_response', 'Avg response', '#46f0f0'),
+    ]
+
+    def __init__(self, root, table, settings):
+        self.table = table
+        self.settings = settings  # sweep() keyword arguments besides the quanta
+        self.rows = []
+        self.worker = None
+        self.outcome = None
+
+        self.window = tk.Toplevel(root)
+        self.window.title(f"Quantum Sweep - {POLICIES[settings['policy']].label}")
+        self.window.configure(bg='#121212')
+
+        controls = tk.Frame(self.window, bg='#1E1E1E', padx=10, pady=10)
+        controls.pack(fill=tk.X)
+        tk.Label(controls, text="Quanta (e.g. 1-20, 25, 30-100:10):",
+                bg='#1E1E1E', fg='#FFFFFF', font=('Consolas', 9)).pack(side=tk.LEFT)
+        self.quanta_entry = tk.Entry(controls, width=30, bg='#2D2D2D', fg='#FFFFFF',
+                                    insertbackground='white', font=('Consolas', 9))
+        self.quanta_entry.insert(0, "1-20")
+        self.quanta_entry.pack(side=tk.LEFT, padx=5)
+        self.run_btn = tk.Button(controls, text="Run", command=self.run,
+                                bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                                activeforeground='#FFFFFF', font=('Consolas', 9, 'bold'))
+        self.run_btn.pack(side=tk.LEFT, padx=5)
+        self.export_btn = tk.Button(controls, text="Export CSV", state=tk.DISABLED, command=self.export_csv,
+                                   bg='#2D2D2D', fg='#FFFFFF', activebackground='#3D3D3D',
+                                   activeforeground='#FFFFFF', font=('Consolas', 9, 'bold'))
+        self.export_btn.pack(side=tk.LEFT, padx=5)
+
+        self.status = tk.StringVar(value=f"{len(table)} processes")
+        tk.Label(self.window, textvariable=self.status, bg='#121212', fg='#4ECDC4',
+                font=('Consolas', 9)).pack(anchor='w', padx=10)
+
+        self.canvas = tk.Canvas(self.window, width=760, height=420, bg='#1E1E1E', highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.canvas.bind('<Configure>', lambda e: self.draw_curves())
+
+    def run(self):
+        try:
+            quanta = parse_quanta(self.quanta_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid quanta: {str(e)}", parent=self.window)
+            return
+
+        self.run_btn.config(state=tk.DISABLED)
+        self.status.set(f"Running {len(quanta)} quanta over {len(self.table)} processes...")
+        self.worker = threading.Thread(target=self.run_sweep, args=(quanta,), daemon=True)
+        self.worker.start()
+        self.window.after(100, self.poll)
+
+    def run_sweep(self, quanta):
+        try:
+            self.outcome = sweep(self.table, quanta, **self.settings)
+        except Exception as e:
+            self.outcome = e
+
+    def poll(self):
+        if self.worker.is_alive():
+            self.window.after(100, self.poll)
+            return
+
+        self.run_btn.config(state=tk.NORMAL)
+        if isinstance(self.outcome, Exception):
+            self.status.set(f"Sweep failed: {self.outcome}")
+            return
+        self.rows = sorted(self.outcome, key=lambda row: row['quantum'])
+        self.export_btn.config(state=tk.NORMAL)
+        best = min(self.rows, key=lambda row: row['avg_waiting'])
+        self.status.set(f"{len(self.rows)} quanta; lowest avg waiting {best['avg_waiting']:.2f} "
+                        f"at quantum {best['quantum']}")
+        self.draw_curves()
+
+    def draw_curves(self):
+        self.canvas.delete("all")
+        if not self.rows:
+            return
+
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        left, right, top, bottom = 60, width - 60, 20, height - 60
+        q_min, q_max = self.rows[0]['quantum'], self.rows[-1]['quantum']
+        t_max = max(row[key] for row in self.rows for key, _, _ in self.series) or 1
+        cs_max = max(row['context_switches'] for row in self.rows) or 1
+
+        def x_of(q):
+            return left + (q - q_min) * (right - left) / ((q_max - q_min) or 1)
+
+        # Axes: time on the left, context switches on the right
+        self.canvas.create_line(left, bottom, right, bottom, fill='#FFFFFF')
+        self.canvas.create_line(left, top, left, bottom, fill='#FFFFFF')
+        self.canvas.create_line(right, top, right, bottom, fill='#f58231')
+        for i in range(6):
+            y = bottom - i * (bottom - top) / 5
+            self.canvas.create_text(left - 5, y, text=f"{t_max * i / 5:.0f}", fill='#FFFFFF',
+                                    font=('Consolas', 8), anchor='e')
+            self.canvas.create_text(right + 5, y, text=f"{cs_max * i / 5:.0f}", fill='#f58231',
+                                    font=('Consolas', 8), anchor='w')
+            q = q_min + (q_max - q_min) * i / 5
+            self.canvas.create_text(x_of(q), bottom + 12, text=f"{q:.0f}", fill='#FFFFFF',
+                                    font=('Consolas', 8))
+        self.canvas.create_text((left + right) / 2, bottom + 28, text="Time quantum", fill='#FFFFFF',
+                                font=('Consolas', 9))
+
+        curves = [(key, label, color, t_max) for key, label, color in self.series]
+        curves.append(('context_switches', 'Context switches', '#f58231', cs_max))
+        for i, (key, label, color, y_max) in enumerate(curves):
+            points = []
+            for row in self.rows:
+                points.extend((x_of(row['quantum']), bottom - row[key] * (bottom - top) / y_max))
+            if len(points) >= 4:
+                self.canvas.create_line(*points, fill=color, width=2)
+            else:
+                x, y = points
+                self.canvas.create_oval(x - 3, y - 3, x + 3, y + 3, fill=color, outline=color)
+
+            # Legend
+            lx = left + i * 140
+            self.canvas.create_rectangle(lx, height - 18, lx + 12, height - 6, fill=color, outline='#333333')
+            self.canvas.create_text(lx + 16, height - 12, text=label, fill='#FFFFFF',
+                                    font=('Consolas', 8), anchor='w')
+
+    def export_csv(self):
+        path = filedialog.asksaveasfilename(parent=self.window, title="Export sweep", defaultextension=".csv",
+                                            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if path:
+            write_sweep_csv(self.rows, path)
+            self.status.set(f"Exported {len(self.rows)} rows to {path}")
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = EnhancedRoundRobinSimulator(root)
+    if len(sys.argv) > 1 and sys.argv[1].endswith('.rrc'):
+        app.open_checkpoint(sys.argv[1])
+    elif len(sys.argv) > 1:
+        app.open_trace(sys.argv[1])
     root.mainloop()
@@ -0,0 +1,207 @@
+"""Benchmark harness for regression tracking.
+
+For each workload size a seeded synthetic workload is generated and the
+engine (with and without a Gantt log), the statistics step and the two
+canvas renderers are timed. Results are written as JSON, and a previous
+result file can be given as a baseline to flag slowdowns.
+
+    python rr_bench.py --output bench.json
+    python rr_bench.py --sizes 100,10000 --baseline bench.json --tolerance 0.2
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from rr_engine import QUEUE_MODES, simulate_table
+from rr_policy import POLICIES
+from rr_stats import compute_stats
+from rr_workload import ARRIVAL_MODELS, BURST_MODELS, generate
+
+DEFAULT_SIZES = [10 ** k for k in range(2, 8)]
+
+
+def best_of(repeat, fn, *args, **kwargs):
+    # Best wall time of `repeat` calls, and the last call's return value
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+def open_renderer():
+    # The renderers need a display; the benchmark records them as skipped
+    # when Tk cannot start
+    try:
+        import tkinter as tk
+        from roundrobin_30_4 import EnhancedRoundRobinSimulator
+        root = tk.Tk()
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+    root.withdraw()
+    return EnhancedRoundRobinSimulator(root), None
+
+
+def render(sim, result, slices):
+    # Replay the first `slices` slices through the block view and the time
+    # usage chart in frames as large as instant playback draws, and return
+    # the time spent in each renderer
+    sim.prepare_views(result)
+    sim.usage_target = result.makespan  # as playback does once the engine is done
+
+    blocks = usage = 0.0
+    gantt = result.gantt
+    chunk = sim.max_slices_per_frame
+    for first in range(0, slices, chunk):
+        sim.replay_index = min(first + chunk, slices)
+        for index in range(first, sim.replay_index) if sim.lane_count else ():
+            sim.lane_slices[gantt.cores[index]].append(index)
+        started = time.perf_counter()
+        sim.draw_process_blocks(first)
+        drawn = time.perf_counter()
+        sim.update_time_usage(first)
+        sim.root.update_idletasks()
+        blocks += drawn - started
+        usage += time.perf_counter() - drawn
+    return blocks, usage
+
+
+def bench_size(n, args, sim):
+    row = {'processes': n}
+    settings = dict(policy=args.policy, cores=args.cores, queues=args.queues,
+                    switch_cost=args.switch_cost, warmup=args.warmup)
+
+    row['generate'], table = best_of(args.repeat, generate, n, args.arrivals, args.bursts,
+                                     mean_burst=args.mean_burst, load=args.load * args.cores,
+                                     seed=args.seed)
+    row['simulate'], result = best_of(args.repeat, simulate_table, table, args.quantum,
+                                      gantt=False, **settings)
+    row['stats'], _ = best_of(args.repeat, compute_stats, result)
+    row['makespan'] = result.makespan
+    row['context_switches'] = result.context_switches
+
+    if n > args.gantt_max:
+        return row
+    row['simulate_gantt'], result = best_of(args.repeat, simulate_table, table, args.quantum,
+                                            gantt=True, **settings)
+    row['slices'] = len(result.gantt)
+    if sim is not None:
+        slices = min(len(result.gantt), args.render_max)
+        row['rendered_slices'] = slices
+        row['draw_process_blocks'], row['update_time_usage'] = min(
+            render(sim, result, slices) for _ in range(args.repeat))
+    return row
+
+
+TIMINGS = ('generate', 'simulate', 'simulate_gantt', 'stats', 'draw_process_blocks', 'update_time_usage')
+
+
+def compare(results, baseline, tolerance):
+    # Timings more than `tolerance` slower than the baseline at the same size
+    previous = {row['processes']: row for row in baseline['results']}
+    regressions = []
+    for row in results:
+        old = previous.get(row['processes'])
+        if old is None:
+            continue
+        for key in TIMINGS:
+            if key in row and key in old and old[key] > 0 and row[key] > old[key] * (1 + tolerance):
+                regressions.append(f"{key} at {row['processes']} processes: "
+                                   f"{old[key]:.4f}s -> {row[key]:.4f}s ({row[key] / old[key] - 1:+.0%})")
+    return regressions
+
+
+def parse_sizes(text):
+    sizes = [int(float(size)) for size in text.split(',') if size.strip()]
+    if not sizes or min(sizes) <= 0:
+        raise ValueError("Sizes must be positive")
+    return sizes
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the engine, statistics and renderers")
+    parser.add_argument('--sizes', default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma separated process counts (default: 1e2 through 1e7)")
+    parser.add_argument('-o', '--output', help="write the results as JSON to this file")
+    parser.add_argument('--baseline', metavar='OLD.json', help="compare against an earlier result file")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed slowdown against the baseline (default: 0.2 = 20%%)")
+    parser.add_argument('--repeat', type=int, default=1, help="report the best of N runs (default: 1)")
+    parser.add_argument('-q', '--quantum', type=int, default=4, help="time quantum (default: 4)")
+    parser.add_argument('-p', '--policy', choices=list(POLICIES), default='rr')
+    parser.add_argument('-c', '--cores', type=int, default=1)
+    parser.add_argument('--queues', choices=QUEUE_MODES, default='global')
+    parser.add_argument('--switch-cost', type=int, default=0)
+    parser.add_argument('--warmup', type=int, default=0)
+    parser.add_argument('--arrivals', choices=ARRIVAL_MODELS, default='poisson')
+    parser.add_argument('--bursts', choices=BURST_MODELS, default='exponential')
+    parser.add_argument('--mean-burst', type=float, default=10)
+    parser.add_argument('--load', type=float, default=0.9, help="offered load per core (default: 0.9)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--gantt-max', type=float, default=1e6,
+                        help="largest size simulated with a full Gantt log (default: 1e6)")
+    parser.add_argument('--render-max', type=int, default=20000,
+                        help="slices replayed through the renderers (default: 20000)")
+    parser.add_argument('--no-render', action='store_true', help="skip the canvas renderers")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        sizes = parse_sizes(args.sizes)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    sim, skipped = (None, "disabled") if args.no_render else open_renderer()
+    if sim is None:
+        print(f"Renderers skipped: {skipped}")
+
+    results = []
+    try:
+        for n in sizes:
+            row = bench_size(n, args, sim)
+            results.append(row)
+            print("  ".join([f"{n:>9}"] + [f"{key} {row[key]:.4f}s" for key in TIMINGS if key in row]))
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if sim is not None:
+            sim.root.destroy()
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'config': {key: value for key, value in vars(args).items()
+                   if key not in ('output', 'baseline', 'tolerance')},
+        'renderers': skipped or "timed",
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
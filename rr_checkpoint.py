@@ -0,0 +1,114 @@
+"""Binary checkpoints of a paused simulation.
+
+A checkpoint holds everything needed to carry on a run: the engine settings,
+its scalars (clock, arrival cursor, counters), its typed columns (remaining
+times, ready queues, running slices, per-process results) and optionally the
+workload and the partial Gantt log. load_checkpoint() rebuilds an engine that
+continues exactly where the saved one stopped; the engine and every policy
+are deterministic, so a resumed run matches an uninterrupted one slice for
+slice.
+
+The .rrc layout is a little-endian header (magic, size of the metadata)
+followed by the JSON metadata (settings, scalars, column names, typecodes
+and lengths, caller extras), the columns in that order and the
+newline-separated UTF-8 process names when the workload is included.
+"""
+import json
+import struct
+import sys
+from array import array
+
+from rr_engine import ProcessTable, make_engine
+
+CHECKPOINT_MAGIC = b'RRC1'
+CHECKPOINT_HEADER = struct.Struct('<4sI')
+
+TABLE_COLUMNS = ('arrivals', 'bursts', 'priorities')
+
+
+def write_checkpoint(engine, f, gantt=True, table=True, extra=None):
+    scalars, columns = engine.save_state(gantt)
+    result = engine.result
+    columns = list(columns.items())
+    names = b''
+    if table:
+        if any('\n' in name for name in result.table.names):
+            raise ValueError("Process names in a checkpoint cannot contain newlines")
+        columns += [(f"table_{name}", getattr(result.table, name)) for name in TABLE_COLUMNS]
+        names = '\n'.join(result.table.names).encode('utf-8')
+
+    meta = {
+        'settings': {'quantum': result.time_quantum, 'policy': result.policy, 'cores': result.cores,
+                     'queues': engine.queues, 'switch_cost': engine.switch_cost,
+                     'warmup': engine.warmup, 'gantt': engine.record},
+        'processes': len(result.table),
+        'scalars': scalars,
+        'columns': [[name, column.typecode, len(column)] for name, column in columns],
+        'names_size': len(names) if table else -1,
+        'extra': extra or {},
+    }
+    meta = json.dumps(meta).encode('utf-8')
+    f.write(CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, len(meta)))
+    f.write(meta)
+    for _, column in columns:
+        if sys.byteorder == 'big':
+            column = array(column.typecode, column)
+            column.byteswap()
+        f.write(column.tobytes())
+    f.write(names)
+
+
+def read_checkpoint(f, source, table=None):
+    # Returns (engine, extra); `table` is required when the checkpoint was
+    # written without its workload
+    header = f.read(CHECKPOINT_HEADER.size)
+    if len(header) < CHECKPOINT_HEADER.size:
+        raise ValueError(f"{source}: not a .rrc checkpoint")
+    magic, meta_size = CHECKPOINT_HEADER.unpack(header)
+    if magic != CHECKPOINT_MAGIC:
+        raise ValueError(f"{source}: not a .rrc checkpoint")
+    try:
+        meta = json.loads(f.read(meta_size).decode('utf-8'))
+    except ValueError as e:
+        raise ValueError(f"{source}: damaged checkpoint metadata ({e})")
+
+    columns = {}
+    for name, typecode, length in meta['columns']:
+        column = array(typecode)
+        try:
+            column.fromfile(f, length)
+        except EOFError:
+            raise ValueError(f"{source}: truncated .rrc checkpoint")
+        if sys.byteorder == 'big':
+            column.byteswap()
+        columns[name] = column
+
+    if meta['names_size'] >= 0:
+        names = f.read(meta['names_size'])
+        if len(names) != meta['names_size']:
+            raise ValueError(f"{source}: truncated .rrc checkpoint")
+        table = ProcessTable()
+        table.names = str(names, 'utf-8').split('\n') if meta['processes'] else []
+        for name in TABLE_COLUMNS:
+            setattr(table, name, columns.pop(f"table_{name}"))
+    elif table is None:
+        raise ValueError(f"{source}: checkpoint has no workload; pass the table it was taken from")
+    if len(table) != meta['processes']:
+        raise ValueError(f"{source}: checkpoint is for {meta['processes']} processes, not {len(table)}")
+
+    settings = meta['settings']
+    engine = make_engine(table, settings['quantum'], settings['gantt'], settings['policy'],
+                         settings['cores'], settings['queues'], settings['switch_cost'], settings['warmup'])
+    engine.load_state(meta['scalars'], columns)
+    return engine, meta['extra']
+
+
+def save_checkpoint(engine, path, gantt=True, extra=None):
+    with open(path, 'wb') as f:
+        write_checkpoint(engine, f, gantt, extra=extra)
+
+
+def load_checkpoint(path):
+    with open(path, 'rb') as f:
+        return read_checkpoint(f, path)
+
@@ -0,0 +1,224 @@
+"""Headless command line front end.
+
+    python rr_cli.py trace.csv --quantum 4
+    python rr_cli.py trace.csv --policy rr,srtf,mlfq
+    python rr_cli.py trace.csv --cores 64 --queues per-core
+    python rr_cli.py trace.csv --switch-cost 1 --warmup 2
+    python rr_cli.py trace.jsonl --convert trace.rrb
+    python rr_cli.py huge.csv --stream
+    python rr_cli.py huge.rrb --until 500000 --checkpoint run.rrc
+    python rr_cli.py --resume run.rrc
+    python rr_cli.py trace.csv --export-gantt gantt.parquet --export-stats stats.csv
+    python rr_cli.py trace.csv --policy rr,srtf --export-gantt gantt.svg
+"""
+import argparse
+import os
+import sys
+import time
+
+from rr_checkpoint import load_checkpoint, save_checkpoint
+from rr_engine import QUEUE_MODES, make_engine, simulate_table
+from rr_export import (CHART_FORMATS, EXPORT_FORMATS, TABLE_FORMATS, detect_export_format, export_gantt,
+                       export_processes)
+from rr_io import FORMATS, iter_workload, load_workload, write_binary
+from rr_policy import POLICIES
+from rr_stats import compute_stats
+from rr_stream import StreamSimulation
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Round Robin scheduling simulator (headless)")
+    parser.add_argument('trace', nargs='?', help="workload trace (" + ", ".join(FORMATS) + ")")
+    parser.add_argument('-q', '--quantum', type=int, default=4, help="time quantum (default: 4)")
+    parser.add_argument('-p', '--policy', default='rr',
+                        help="comma separated policies to run one after another, or 'all' "
+                             "(" + ", ".join(POLICIES) + "; default: rr)")
+    parser.add_argument('-c', '--cores', type=int, default=1, help="number of CPUs (default: 1)")
+    parser.add_argument('--queues', choices=QUEUE_MODES, default='global',
+                        help="one ready queue shared by all cores, or per-core queues with "
+                             "work stealing (default: global)")
+    parser.add_argument('--switch-cost', type=int, default=0,
+                        help="time charged when a core switches to a different process (default: 0)")
+    parser.add_argument('--warmup', type=int, default=0,
+                        help="cache warm-up time added when a process resumes after a switch or "
+                             "migration (default: 0)")
+    parser.add_argument('--format', choices=sorted(set(FORMATS.values())),
+                        help="trace format (default: from the file extension)")
+    parser.add_argument('--gantt', action='store_true',
+                        help="record every slice instead of allowing the closed-form fast path")
+    parser.add_argument('--convert', metavar='OUT.rrb',
+                        help="write the loaded trace as a .rrb binary trace and exit")
+    parser.add_argument('--stream', action='store_true',
+                        help="stream an arrival-ordered trace without keeping finished processes")
+    parser.add_argument('--until', type=int, metavar='TIME',
+                        help="stop the run when its clock reaches TIME")
+    parser.add_argument('--checkpoint', metavar='OUT.rrc',
+                        help="write a checkpoint of the run where it stopped")
+    parser.add_argument('--resume', metavar='IN.rrc',
+                        help="continue the run saved in a checkpoint instead of loading a trace")
+    parser.add_argument('--export-gantt', metavar='PATH',
+                        help="write the Gantt slices (" + ", ".join(EXPORT_FORMATS) + "); implies --gantt")
+    parser.add_argument('--export-stats', metavar='PATH',
+                        help="write per-process statistics ("
+                             + ", ".join(ext for ext, fmt in EXPORT_FORMATS.items() if fmt in TABLE_FORMATS)
+                             + ")")
+    parser.add_argument('--width', type=int, default=1200,
+                        help="width in pixels of an exported SVG or PNG chart (default: 1200)")
+    return parser
+
+
+def parse_policies(text):
+    if text == 'all':
+        return list(POLICIES)
+    policies = [name.strip() for name in text.split(',') if name.strip()]
+    for name in policies:
+        if name not in POLICIES:
+            raise ValueError(f"Unknown policy '{name}' (expected one of {', '.join(POLICIES)})")
+    return policies
+
+
+def export_path(path, policy, several):
+    # With several policies each one gets its own file: gantt.csv -> gantt-rr.csv
+    if not several:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}-{policy}{ext}"
+
+
+def check_exports(args):
+    # Reject unknown export formats, and Parquet or Arrow without pyarrow,
+    # before spending time on the run
+    if args.export_gantt:
+        detect_export_format(args.export_gantt, TABLE_FORMATS + CHART_FORMATS)
+    if args.export_stats:
+        detect_export_format(args.export_stats, TABLE_FORMATS)
+
+
+def export_results(result, args, several=False):
+    # Returns the paths written
+    written = []
+    if args.export_gantt:
+        written.append(export_path(args.export_gantt, result.policy, several))
+        export_gantt(result, written[-1], width=args.width)
+    if args.export_stats:
+        written.append(export_path(args.export_stats, result.policy, several))
+        export_processes(result, written[-1])
+    return written
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.trace is None and not args.resume:
+        parser.error("a trace is required unless --resume is given")
+    if args.stream:
+        return run_stream(args)
+    if args.resume or args.until is not None or args.checkpoint:
+        return run_checkpointed(args)
+    try:
+        policies = parse_policies(args.policy)
+        check_exports(args)
+        started = time.perf_counter()
+        table = load_workload(args.trace, args.format)
+        loaded = time.perf_counter()
+        if args.convert:
+            write_binary(table, args.convert)
+            print(f"Wrote {len(table)} processes to {args.convert}")
+            return 0
+
+        for i, policy in enumerate(policies):
+            began = time.perf_counter()
+            result = simulate_table(table, args.quantum, gantt=args.gantt or bool(args.export_gantt),
+                                    policy=policy,
+                                    cores=args.cores, queues=args.queues,
+                                    switch_cost=args.switch_cost, warmup=args.warmup)
+            simulated = time.perf_counter()
+            stats = compute_stats(result)
+            if i:
+                print()
+            print(f"Policy: {POLICIES[policy].label}  Cores: {args.cores}  Processes: {len(table)}  "
+                  f"Quantum: {args.quantum}  Makespan: {result.makespan}  "
+                  f"Context switches: {result.context_switches}")
+            print("\n".join(stats.summary()))
+            print(f"Simulate: {simulated - began:.3f}s")
+            for path in export_results(result, args, len(policies) > 1):
+                print(f"Wrote {path}")
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Load: {loaded - started:.3f}s")
+    return 0
+
+
+def run_checkpointed(args):
+    # One policy, optionally resumed from a checkpoint and stopped at a time
+    # bound, saving the state it stopped in
+    started = time.perf_counter()
+    try:
+        check_exports(args)
+        if args.resume:
+            engine, _ = load_checkpoint(args.resume)
+        else:
+            policies = parse_policies(args.policy)
+            if len(policies) != 1:
+                raise ValueError("Checkpointed runs take a single policy")
+            table = load_workload(args.trace, args.format)
+            engine = make_engine(table, args.quantum, args.gantt or bool(args.export_gantt), policies[0],
+                                 args.cores, args.queues, args.switch_cost, args.warmup)
+        if args.until is None:
+            engine.step()
+        else:
+            engine.step(until=args.until)
+        simulated = time.perf_counter()
+        if args.checkpoint:
+            save_checkpoint(engine, args.checkpoint)
+        # Exports describe a finished run
+        written = export_results(engine.result, args) if engine.done else []
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    result = engine.result
+    print(f"Policy: {POLICIES[result.policy].label}  Cores: {result.cores}  Processes: {len(result.table)}  "
+          f"Quantum: {result.time_quantum}  Time: {engine.time}  "
+          f"Context switches: {result.context_switches}")
+    if engine.done:
+        print("\n".join(compute_stats(result).summary()))
+    else:
+        finished = len(result.table) - engine.unfinished
+        print(f"Stopped at time {engine.time} with {finished} of {len(result.table)} processes finished")
+    print(f"Simulate: {simulated - started:.3f}s")
+    if args.checkpoint:
+        print(f"Wrote checkpoint to {args.checkpoint}")
+    for path in written:
+        print(f"Wrote {path}")
+    if not engine.done and (args.export_gantt or args.export_stats):
+        print("Exports skipped: the run has not finished")
+    return 0
+
+
+def run_stream(args):
+    if args.policy != 'rr' or args.cores != 1 or args.switch_cost or args.warmup:
+        print("error: --stream only supports the rr policy on one core without overhead", file=sys.stderr)
+        return 1
+    if args.export_gantt or args.export_stats:
+        print("error: --stream keeps no per-process results to export", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    try:
+        simulation = StreamSimulation(iter_workload(args.trace, args.format), args.quantum)
+        stats = simulation.run()
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Processes: {stats.count}  Quantum: {args.quantum}  Makespan: {stats.makespan}  "
+          f"Context switches: {simulation.context_switches}")
+    print("\n".join(stats.summary()))
+    print(f"Stream: {time.perf_counter() - started:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,737 @@
+"""Tk-free CPU scheduling engine.
+
+simulate() runs a whole workload to completion at full CPU speed and returns
+a SimulationResult; the GUI replays that result slice by slice, and batch
+jobs can call it directly on machines with no display. Round Robin is the
+default policy; the others in rr_policy plug into the same engine loop.
+
+Processes are identified by integer pid (their row in a ProcessTable) and
+all per-process and per-slice data is stored in typed `array` columns.
+An engine's state is a set of scalars plus those columns (save_state), which
+rr_checkpoint writes to disk and restores into a fresh engine (load_state).
+"""
+from array import array
+from bisect import bisect_right
+from collections import deque
+from heapq import heappop, heappush
+from itertools import accumulate
+from operator import sub
+
+from rr_policy import make_policy
+
+# Gantt entries for gaps where no process is ready
+IDLE = -1
+IDLE_NAME = "(idle)"
+
+# Gantt entries for dispatch overhead: the context switch itself plus the
+# cache warm-up of a process resuming after others ran on its core
+OVERHEAD = -2
+OVERHEAD_NAME = "(switch)"
+
+# step() runs without a time bound unless given one below this
+NO_TIME_LIMIT = 1 << 63
+
+# Multi-core ready queue layouts: one queue shared by every core, or one
+# queue per core with idle cores stealing from the others
+QUEUE_MODES = ('global', 'per-core')
+
+
+def zeros(n, typecode='q'):
+    return array(typecode, bytes(array(typecode).itemsize * n))
+
+
+class ProcessTable:
+    # Columnar process storage; a process's pid is its row index
+    def __init__(self, names=(), arrivals=(), bursts=(), priorities=None):
+        self.names = list(names)
+        try:
+            self.arrivals = array('q', arrivals)
+            self.bursts = array('q', bursts)
+            self.priorities = zeros(len(self.names)) if priorities is None else array('q', priorities)
+        except OverflowError:
+            raise ValueError("Arrival, burst and priority values must fit in 64 bits")
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, name, arrival, burst, priority=0):
+        self.names.append(name)
+        self.arrivals.append(arrival)
+        self.bursts.append(burst)
+        self.priorities.append(priority)
+
+    def name(self, pid):
+        if pid < 0:
+            return IDLE_NAME if pid == IDLE else OVERHEAD_NAME
+        return self.names[pid]
+
+
+class GanttLog:
+    # Slices stored as three typed columns instead of (name, start, end) tuples
+    def __init__(self):
+        self.pids = array('i')
+        self.starts = array('q')
+        self.ends = array('q')
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __getitem__(self, index):
+        return self.pids[index], self.starts[index], self.ends[index]
+
+    def __iter__(self):
+        return zip(self.pids, self.starts, self.ends)
+
+    def append(self, pid, start, end):
+        self.pids.append(pid)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def started_by(self, time):
+        # Length of the prefix of slices dispatched by `time`
+        return bisect_right(self.starts, time)
+
+
+class CoreGanttLog(GanttLog):
+    # Multi-core slices, in dispatch order, with the core that ran each one
+    def __init__(self):
+        super().__init__()
+        self.cores = array('h')
+
+    def append(self, pid, start, end, core=0):
+        self.pids.append(pid)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.cores.append(core)
+
+    def started_by(self, time):
+        # Starts are not sorted here: a core's overhead slice comes right
+        # before the process slice it delays, and a slice another core
+        # dispatched at the same time may follow with an earlier start.
+        # The dispatch time (the start of the overhead slice, if any) is
+        # sorted, so the prefix is found by bisecting on it.
+        pids = self.pids
+        starts = self.starts
+        low, high = 0, len(pids)
+        while low < high:
+            mid = (low + high) // 2
+            dispatched = starts[mid - 1] if mid and pids[mid - 1] == OVERHEAD and pids[mid] != OVERHEAD \
+                else starts[mid]
+            if dispatched <= time:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+
+class SimulationResult:
+    def __init__(self, table, quantum, policy='rr', cores=1):
+        self.table = table
+        self.time_quantum = quantum
+        self.policy = policy
+        self.cores = cores
+
+        n = len(table)
+        self.gantt = GanttLog()  # every slice in order, idle gaps included
+        self.completion_times = zeros(n)
+        self.first_run_times = array('q', [-1]) * n
+        self.makespan = 0
+        self.idle_time = 0  # summed over cores
+        self.context_switches = 0  # dispatches of a different process than the core ran before
+        self.core_switches = zeros(cores)  # context switches per core
+        self.core_busy = zeros(cores)  # useful work plus overhead
+        self.migrations = 0  # dispatches on a different core than the process's previous slice
+        self.overhead_time = 0  # time spent switching and warming caches, summed over cores
+
+    def save_state(self, gantt=True):
+        # Scalars and columns of a partial result; the Gantt log is optional
+        scalars = {'makespan': self.makespan, 'idle_time': self.idle_time,
+                   'context_switches': self.context_switches, 'migrations': self.migrations,
+                   'overhead_time': self.overhead_time, 'slices': len(self.gantt)}
+        columns = {'completion_times': self.completion_times, 'first_run_times': self.first_run_times,
+                   'core_busy': self.core_busy, 'core_switches': self.core_switches}
+        if gantt:
+            columns.update(gantt_pids=self.gantt.pids, gantt_starts=self.gantt.starts,
+                           gantt_ends=self.gantt.ends)
+            if isinstance(self.gantt, CoreGanttLog):
+                columns['gantt_cores'] = self.gantt.cores
+        return scalars, columns
+
+    def load_state(self, scalars, columns):
+        for name in ('makespan', 'idle_time', 'context_switches', 'migrations', 'overhead_time'):
+            setattr(self, name, scalars[name])
+        self.completion_times = columns['completion_times']
+        self.first_run_times = columns['first_run_times']
+        self.core_busy = columns['core_busy']
+        self.core_switches = columns['core_switches']
+        if 'gantt_pids' in columns:
+            self.gantt.pids = columns['gantt_pids']
+            self.gantt.starts = columns['gantt_starts']
+            self.gantt.ends = columns['gantt_ends']
+            if isinstance(self.gantt, CoreGanttLog):
+                self.gantt.cores = columns['gantt_cores']
+
+    @property
+    def turnaround_times(self):
+        return array('q', map(sub, self.completion_times, self.table.arrivals))
+
+    @property
+    def waiting_times(self):
+        return array('q', map(sub, self.turnaround_times, self.table.bursts))
+
+    @property
+    def response_times(self):
+        return array('q', map(sub, self.first_run_times, self.table.arrivals))
+
+
+def validate_table(table, quantum, cores=1, switch_cost=0, warmup=0):
+    if quantum <= 0:
+        raise ValueError("Quantum must be positive")
+    if switch_cost < 0 or warmup < 0:
+        raise ValueError("Switch cost and warm-up penalty must not be negative")
+    if not 1 <= cores <= 32767:
+        raise ValueError("Core count must be between 1 and 32767")
+    if len(table) and min(table.arrivals) < 0:
+        raise ValueError("Arrival times must not be negative")
+    if len(table) and min(table.bursts) <= 0:
+        raise ValueError("Burst times must be positive")
+
+
+def simulate(processes, arrivals, bursts, quantum, gantt=True, policy='rr', cores=1, queues='global',
+             switch_cost=0, warmup=0):
+    if len(arrivals) != len(processes):
+        raise ValueError("Arrival times count doesn't match process count")
+    if len(processes) != len(bursts):
+        raise ValueError("Process count doesn't match burst times count")
+    return simulate_table(ProcessTable(processes, arrivals, bursts), quantum, gantt, policy, cores, queues,
+                          switch_cost, warmup)
+
+
+def simulate_table(table, quantum, gantt=True, policy='rr', cores=1, queues='global',
+                   switch_cost=0, warmup=0):
+    # With gantt=False no slices are recorded, which lets single-core Round Robin
+    # over non-overlapping batches of simultaneous arrivals skip simulation entirely
+    engine = make_engine(table, quantum, gantt, policy, cores, queues, switch_cost, warmup)
+    if not gantt and policy == 'rr' and cores == 1 and not switch_cost and not warmup and \
+            closed_form(table, quantum, engine.arrival_order, engine.result):
+        return engine.result
+    return engine.run()
+
+
+def make_engine(table, quantum, gantt=True, policy='rr', cores=1, queues='global',
+                switch_cost=0, warmup=0):
+    # switch_cost is charged whenever a core changes process; warmup is added
+    # when the incoming process has run before, since its cache is cold after
+    # a switch or a migration
+    if cores == 1:
+        return SchedulingEngine(table, quantum, gantt, policy, switch_cost, warmup)
+    return MultiCoreEngine(table, quantum, cores, gantt, policy, queues, switch_cost, warmup)
+
+
+def policy_columns(columns, prefix):
+    # The columns a policy saved under prefix.0, prefix.1, ...
+    found = []
+    while f"{prefix}.{len(found)}" in columns:
+        found.append(columns[f"{prefix}.{len(found)}"])
+    return found
+
+
+class SchedulingEngine:
+    # Resumable simulation state; step() advances it by a bounded number of
+    # slices so callers can interleave simulation with other work. The policy
+    # owns the ready queue and decides what runs and for how long.
+    def __init__(self, table, quantum, gantt=True, policy='rr', switch_cost=0, warmup=0):
+        validate_table(table, quantum, 1, switch_cost, warmup)
+        self.policy = make_policy(policy, table, quantum)
+        self.result = SimulationResult(table, quantum, policy)
+        self.queues = 'global'
+        self.record = gantt
+        self.switch_cost = switch_cost
+        self.warmup = warmup
+        n = len(table)
+
+        # Arrival event index: processes sorted by (arrival, input order). The
+        # cursor admits each process to the ready queue exactly once, so no
+        # membership test against the queue is ever needed.
+        self.arrival_order = array('i', sorted(range(n), key=table.arrivals.__getitem__))
+        self.cursor = 0
+        self.ready = 0  # processes in the policy's ready queue
+        self.remaining = array('q', table.bursts)
+        self.unfinished = n
+        self.time = 0
+        self.idle = 0
+        self.dispatches = 0  # dispatches that changed the running process
+        self.last = IDLE
+        self.done = False
+
+    def run(self):
+        self.step()
+        return self.result
+
+    def save_state(self, gantt=True):
+        scalars, columns = self.result.save_state(gantt)
+        scalars.update(cursor=self.cursor, ready=self.ready, time=self.time, unfinished=self.unfinished,
+                       idle=self.idle, dispatches=self.dispatches, last=self.last, done=self.done)
+        columns['remaining'] = self.remaining
+        for k, column in enumerate(self.policy.save_state()):
+            columns[f"policy.{k}"] = column
+        return scalars, columns
+
+    def load_state(self, scalars, columns):
+        self.result.load_state(scalars, columns)
+        for name in ('cursor', 'ready', 'time', 'unfinished', 'idle', 'dispatches', 'last', 'done'):
+            setattr(self, name, scalars[name])
+        self.remaining = columns['remaining']
+        self.policy.load_state(policy_columns(columns, 'policy'))
+
+    def step(self, limit=-1, until=NO_TIME_LIMIT):
+        # Produce at most `limit` slices (idle gaps included), or run to the
+        # end when limit is negative. Stops early once the clock reaches
+        # `until`, before admitting or dispatching anything at that time.
+        # Returns the number of slices produced.
+        result = self.result
+        arrivals = result.table.arrivals
+        arrival_order = self.arrival_order
+        n = len(arrival_order)
+        record = self.record
+        gantt = result.gantt
+        first_run = result.first_run_times
+        completion = result.completion_times
+        remaining = self.remaining
+        policy = self.policy
+        admit = policy.admit
+        pick = policy.pick
+        slice_length = policy.slice_length
+        requeue = policy.requeue
+        preemptive = policy.preemptive
+        switch_cost = self.switch_cost
+        warmup = self.warmup
+        charge = switch_cost or warmup
+        overhead = result.overhead_time
+        ready = self.ready
+        cursor = self.cursor
+        time = self.time
+        unfinished = self.unfinished
+        idle = self.idle
+        dispatches = self.dispatches
+        last = self.last
+        produced = 0
+
+        while (limit < 0 or produced < limit) and time < until:
+            while cursor < n and arrivals[arrival_order[cursor]] <= time:
+                admit(arrival_order[cursor])
+                ready += 1
+                cursor += 1
+
+            if not ready:
+                if not unfinished:
+                    self.done = True
+                    break
+                # Jump the clock straight to the next arrival as one idle slice
+                next_arrival = arrivals[arrival_order[cursor]]
+                if record:
+                    gantt.append(IDLE, time, next_arrival)
+                idle += next_arrival - time
+                time = next_arrival
+                produced += 1
+                continue
+
+            process_idx = pick()
+            ready -= 1
+            if process_idx != last:
+                if charge and last != IDLE:
+                    cost = switch_cost + (warmup if first_run[process_idx] >= 0 else 0)
+                    if cost:
+                        if record:
+                            gantt.append(OVERHEAD, time, time + cost)
+                        overhead += cost
+                        time += cost
+                        produced += 1
+                dispatches += 1
+                last = process_idx
+            if first_run[process_idx] < 0:
+                first_run[process_idx] = time
+
+            exec_time = slice_length(process_idx, remaining[process_idx])
+            if preemptive:
+                exec_time = cut_at_arrival(exec_time, time, arrivals, arrival_order, cursor)
+            start_time = time
+            end_time = start_time + exec_time
+            if record:
+                gantt.append(process_idx, start_time, end_time)
+            produced += 1
+
+            remaining[process_idx] -= exec_time
+            time = end_time
+
+            # Arrivals during the slice queue up ahead of the preempted process
+            while cursor < n and arrivals[arrival_order[cursor]] <= time:
+                admit(arrival_order[cursor])
+                ready += 1
+                cursor += 1
+
+            if remaining[process_idx] > 0:
+                requeue(process_idx, remaining[process_idx], exec_time)
+                ready += 1
+            else:
+                completion[process_idx] = time
+                unfinished -= 1
+
+        if not unfinished:
+            self.done = True
+        self.ready = ready
+        self.cursor = cursor
+        self.time = time
+        self.unfinished = unfinished
+        self.idle = idle
+        self.dispatches = dispatches
+        self.last = last
+
+        result.makespan = time
+        result.idle_time = idle
+        result.context_switches = max(0, dispatches - 1)
+        result.core_switches[0] = result.context_switches
+        result.core_busy[0] = time - idle
+        result.overhead_time = overhead
+        return produced
+
+
+def cut_at_arrival(exec_time, time, arrivals, arrival_order, cursor):
+    # Preemptive policies end a slice at the first arrival after `time`;
+    # arrivals during dispatch overhead are not yet admitted and are skipped
+    n = len(arrival_order)
+    while cursor < n and arrivals[arrival_order[cursor]] <= time:
+        cursor += 1
+    if cursor < n:
+        return min(exec_time, arrivals[arrival_order[cursor]] - time)
+    return exec_time
+
+
+class MultiCoreEngine:
+    # Event-driven simulation of `cores` CPUs. Running slices sit in a heap
+    # keyed by their end time; at each event the finished process is requeued
+    # and the freed core dispatches again, then idle cores are woken for any
+    # other ready processes. Same step()/run() interface as SchedulingEngine.
+    def __init__(self, table, quantum, cores, gantt=True, policy='rr', queues='global',
+                 switch_cost=0, warmup=0):
+        validate_table(table, quantum, cores, switch_cost, warmup)
+        if queues not in QUEUE_MODES:
+            raise ValueError(f"Unknown queue mode '{queues}' (expected one of {', '.join(QUEUE_MODES)})")
+        first = make_policy(policy, table, quantum)
+        self.queues = queues
+        self.stealing = queues == 'per-core'
+        self.policies = [first] + [first.for_core() for _ in range(cores - 1)] if self.stealing else [first]
+        self.result = SimulationResult(table, quantum, policy, cores)
+        self.result.gantt = CoreGanttLog()  # busy slices only; idle is per-core gaps
+        self.record = gantt
+        self.switch_cost = switch_cost
+        self.warmup = warmup
+        n = len(table)
+
+        self.arrival_order = array('i', sorted(range(n), key=table.arrivals.__getitem__))
+        self.cursor = 0
+        self.ready = zeros(len(self.policies))  # ready processes per queue
+        self.total_ready = 0
+        # Queues in the order they last became non-empty, for stealing; an
+        # entry goes stale when its queue drains and is dropped lazily
+        self.stocked = deque()
+        self.remaining = array('q', table.bursts)
+        self.unfinished = n
+        self.time = 0
+        self.running = []  # heap of (end time, core, pid, slice length)
+        self.idle_cores = list(range(cores))  # heap of idle core ids
+        self.waiting = deque()  # cores that dispatch at the current time
+        self.last_pid = array('i', [IDLE]) * cores
+        self.last_core = array('h', [-1]) * n
+        self.done = False
+
+    def run(self):
+        self.step()
+        return self.result
+
+    def save_state(self, gantt=True):
+        scalars, columns = self.result.save_state(gantt)
+        scalars.update(cursor=self.cursor, total_ready=self.total_ready, unfinished=self.unfinished,
+                       time=self.time, done=self.done)
+        columns.update(remaining=self.remaining, ready=self.ready, last_pid=self.last_pid,
+                       last_core=self.last_core, idle_cores=array('q', self.idle_cores),
+                       waiting=array('q', self.waiting), stocked=array('q', self.stocked))
+        # The running heap as parallel columns, kept in heap order
+        for k, name in enumerate(('running_ends', 'running_cores', 'running_pids', 'running_ran')):
+            columns[name] = array('q', (event[k] for event in self.running))
+        for queue, policy in enumerate(self.policies):
+            for k, column in enumerate(policy.save_state()):
+                columns[f"policy{queue}.{k}"] = column
+        return scalars, columns
+
+    def load_state(self, scalars, columns):
+        self.result.load_state(scalars, columns)
+        for name in ('cursor', 'total_ready', 'unfinished', 'time', 'done'):
+            setattr(self, name, scalars[name])
+        self.remaining = columns['remaining']
+        self.ready = columns['ready']
+        self.last_pid = columns['last_pid']
+        self.last_core = columns['last_core']
+        self.idle_cores = list(columns['idle_cores'])
+        self.waiting = deque(columns['waiting'])
+        self.stocked = deque(columns['stocked'])
+        self.running = list(zip(columns['running_ends'], columns['running_cores'],
+                                columns['running_pids'], columns['running_ran']))
+        for queue, policy in enumerate(self.policies):
+            policy.load_state(policy_columns(columns, f"policy{queue}"))
+
+    def step(self, limit=-1, until=NO_TIME_LIMIT):
+        # Produce at most `limit` slices, or run to the end when limit is
+        # negative. Stops early once the clock reaches `until`, before
+        # dispatching anything at that time. Returns the number of slices
+        # produced.
+        result = self.result
+        arrivals = result.table.arrivals
+        arrival_order = self.arrival_order
+        n = len(arrival_order)
+        cores = result.cores
+        record = self.record
+        gantt = result.gantt
+        first_run = result.first_run_times
+        completion = result.completion_times
+        core_busy = result.core_busy
+        core_switches = result.core_switches
+        remaining = self.remaining
+        policies = self.policies
+        picks = [policy.pick for policy in policies]
+        slice_lengths = [policy.slice_length for policy in policies]
+        admits = [policy.admit for policy in policies]
+        requeues = [policy.requeue for policy in policies]
+        stealing = self.stealing
+        stocked = self.stocked
+        preemptive = policies[0].preemptive
+        switch_cost = self.switch_cost
+        warmup = self.warmup
+        overhead = result.overhead_time
+        ready = self.ready
+        running = self.running
+        idle_cores = self.idle_cores
+        waiting = self.waiting
+        last_pid = self.last_pid
+        last_core = self.last_core
+        cursor = self.cursor
+        total_ready = self.total_ready
+        unfinished = self.unfinished
+        time = self.time
+        switches = result.context_switches
+        migrations = result.migrations
+        produced = 0
+
+        while (limit < 0 or produced < limit) and time < until:
+            if waiting:
+                core = waiting.popleft()
+                if not total_ready:
+                    heappush(idle_cores, core)
+                    continue
+                queue = core if stealing else 0
+                if not ready[queue]:
+                    # Steal from the queue that has had work the longest
+                    while not ready[stocked[0]]:
+                        stocked.popleft()
+                    queue = stocked[0]
+                pid = picks[queue]()
+                ready[queue] -= 1
+                total_ready -= 1
+
+                start_time = time
+                switched = pid != last_pid[core] and last_pid[core] != IDLE
+                migrated = last_core[pid] >= 0 and last_core[pid] != core
+                cost = (switch_cost if switched else 0) + \
+                    (warmup if (switched or migrated) and last_core[pid] >= 0 else 0)
+                if cost:
+                    if record:
+                        gantt.append(OVERHEAD, time, time + cost, core)
+                    produced += 1
+                    overhead += cost
+                    core_busy[core] += cost
+                    start_time += cost
+                if switched:
+                    switches += 1
+                    core_switches[core] += 1
+                if migrated:
+                    migrations += 1
+                last_pid[core] = pid
+                last_core[pid] = core
+                if first_run[pid] < 0:
+                    first_run[pid] = start_time
+
+                exec_time = slice_lengths[queue](pid, remaining[pid])
+                if preemptive:
+                    exec_time = cut_at_arrival(exec_time, start_time, arrivals, arrival_order, cursor)
+                end_time = start_time + exec_time
+                if record:
+                    gantt.append(pid, start_time, end_time, core)
+                produced += 1
+                remaining[pid] -= exec_time
+                if not remaining[pid]:
+                    # Set at dispatch so the completion is known as soon as
+                    # the final slice is in the log; the process only counts
+                    # as finished when the slice ends
+                    completion[pid] = end_time
+                core_busy[core] += exec_time
+                heappush(running, (end_time, core, pid, exec_time))
+                continue
+
+            # Advance the clock to the next arrival an idle core can take, or
+            # to the next slice end
+            next_arrival = arrivals[arrival_order[cursor]] if cursor < n else -1
+            if next_arrival >= 0 and idle_cores and (not running or next_arrival <= running[0][0]):
+                time = next_arrival
+                event = None
+            elif running:
+                event = heappop(running)
+                time = event[0]
+            else:
+                self.done = True
+                break
+
+            while cursor < n and arrivals[arrival_order[cursor]] <= time:
+                pid = arrival_order[cursor]
+                queue = cursor % cores if stealing else 0
+                if stealing and not ready[queue]:
+                    stocked.append(queue)
+                admits[queue](pid)
+                ready[queue] += 1
+                total_ready += 1
+                cursor += 1
+
+            if event is not None:
+                _, core, pid, ran = event
+                if remaining[pid] > 0:
+                    queue = core if stealing else 0
+                    if stealing and not ready[queue]:
+                        stocked.append(queue)
+                    requeues[queue](pid, remaining[pid], ran)
+                    ready[queue] += 1
+                    total_ready += 1
+                else:
+                    unfinished -= 1
+                waiting.append(core)
+
+            # Wake as many idle cores as there are ready processes left over
+            while idle_cores and total_ready > len(waiting):
+                waiting.append(heappop(idle_cores))
+
+        if not unfinished and not running:
+            self.done = True
+        self.cursor = cursor
+        self.total_ready = total_ready
+        self.unfinished = unfinished
+        self.time = time
+
+        result.makespan = time
+        result.idle_time = time * cores - sum(core_busy)
+        result.context_switches = switches
+        result.migrations = migrations
+        result.overhead_time = overhead
+        return produced
+
+
+def closed_form(table, quantum, arrival_order, result):
+    # Round Robin over a batch that arrives together is fixed by the bursts
+    # alone, so completion and first-run times can be computed without
+    # simulating slices. Returns False, leaving result untouched, when a
+    # batch arrives before the previous one has drained.
+    arrivals = table.arrivals
+    bursts = table.bursts
+    n = len(table)
+
+    batches = []
+    time = 0
+    idle = 0
+    i = 0
+    while i < n:
+        batch_arrival = arrivals[arrival_order[i]]
+        if batch_arrival < time:
+            return False
+        idle += batch_arrival - time
+        j = i
+        time = batch_arrival
+        while j < n and arrivals[arrival_order[j]] == batch_arrival:
+            time += bursts[arrival_order[j]]
+            j += 1
+        batches.append((batch_arrival, arrival_order[i:j]))
+        i = j
+
+    dispatches = 0
+    for batch_arrival, pids in batches:
+        dispatches += closed_form_batch(pids, bursts, quantum, batch_arrival, result)
+    result.makespan = time
+    result.idle_time = idle
+    result.context_switches = max(0, dispatches - 1)
+    result.core_switches[0] = result.context_switches
+    result.core_busy[0] = time - idle
+    return True
+
+
+def closed_form_batch(pids, bursts, quantum, start, result):
+    # Process i needs k_i = ceil(b_i / q) rounds. Before its last round every
+    # process j has run min(b_j, (k_i - 1) q); in that round each earlier
+    # process with k_j > k_i runs a full quantum and each earlier one with
+    # k_j == k_i runs its final piece. A Fenwick tree over k counts the
+    # earlier processes with k_j > k_i, so the batch costs O(m log m).
+    # Returns how many of the batch's dispatches change the running process.
+    completion = result.completion_times
+    first_run = result.first_run_times
+    m = len(pids)
+    batch_bursts = [bursts[pid] for pid in pids]
+    rounds = [(b + quantum - 1) // quantum for b in batch_bursts]
+
+    sorted_bursts = sorted(batch_bursts)
+    prefix = [0]
+    prefix.extend(accumulate(sorted_bursts))
+
+    rank = {k: r for r, k in enumerate(sorted(set(rounds)), 1)}
+    tree = [0] * (len(rank) + 1)
+    equal_count = {}
+    equal_sum = {}
+    first = start
+
+    for i, pid in enumerate(pids):
+        burst = batch_bursts[i]
+        k = rounds[i]
+        done_before = (k - 1) * quantum
+
+        below = bisect_right(sorted_bursts, done_before)
+        before_last_round = prefix[below] + (m - below) * done_before
+
+        # Earlier processes with k_j <= k_i, from the Fenwick tree
+        r = rank[k]
+        not_greater = 0
+        while r:
+            not_greater += tree[r]
+            r &= r - 1
+        count = equal_count.get(k, 0)
+        total = equal_sum.get(k, 0)
+        last_round = quantum * (i - not_greater) + total - count * done_before
+
+        completion[pid] = start + before_last_round + last_round + burst - done_before
+        first_run[pid] = first
+        first += min(quantum, burst)
+
+        r = rank[k]
+        while r < len(tree):
+            tree[r] += 1
+            r += r & -r
+        equal_count[k] = count + 1
+        equal_sum[k] = total + burst
+
+    # Every round dispatches each surviving process once. Once a single
+    # process outlives the rest of the batch it is re-dispatched back to back,
+    # which is not a context switch.
+    top = max(rounds)
+    if m == 1:
+        repeats = top - 1
+    elif rounds.count(top) > 1:
+        repeats = 0
+    else:
+        second = max(k for k in rounds if k < top)
+        survivor = rounds.index(top)
+        last_of_round = max(i for i, k in enumerate(rounds) if k == second)
+        repeats = top - second - 1 + (survivor > last_of_round)
+    return sum(rounds) - repeats
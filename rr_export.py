@@ -0,0 +1,347 @@
+"""Export of simulation results for analysis outside the GUI.
+
+Gantt slices and per-process statistics are written as CSV, as columnar
+.npz (one .npy array per column, readable with numpy.load), or as Parquet
+or Arrow IPC files when pyarrow is installed. The Gantt chart can also be
+rendered to SVG or PNG. Every writer pulls rows in chunks of EXPORT_CHUNK,
+so a multi-million-slice run never builds one huge string or table.
+
+Charts use the GUI's palette and seeded shuffle, so an export has the same
+colors as the screen for the same seed. Slices narrower than a pixel are
+merged per row, which bounds the size of a rendering by its width rather
+than by the length of the run.
+"""
+import csv
+import os
+import random
+import struct
+import sys
+import zipfile
+import zlib
+from array import array
+from operator import sub
+
+from rr_engine import IDLE, OVERHEAD, CoreGanttLog
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Parquet and Arrow export are optional
+    pyarrow = None
+
+EXPORT_CHUNK = 65536  # rows per chunk
+
+EXPORT_FORMATS = {
+    '.csv': 'csv',
+    '.npz': 'npz',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.svg': 'svg',
+    '.png': 'png',
+}
+TABLE_FORMATS = ('csv', 'npz', 'parquet', 'arrow')
+CHART_FORMATS = ('svg', 'png')
+
+PROCESS_COLORS = [
+    '#e6194b', '#3cb44b', '#ffe119', '#f58231',
+    '#46f0f0', '#f032e6', '#bcf60c', '#fabebe',
+    '#fffac8', '#aaffc3', '#ffd8b1'
+]
+IDLE_COLOR = '#555555'
+OVERHEAD_COLOR = '#A93226'
+BACKGROUND = '#1E1E1E'
+FOREGROUND = '#FFFFFF'
+
+MAX_PROCESS_ROWS = 40  # larger single-core runs are drawn as one CPU row
+MAX_CHART_HEIGHT = 4000  # rows are squeezed to fit, as in the GUI's lanes
+
+
+def palette(seed=0):
+    # The process colors in the order pids use them: pid k gets entry k % len
+    colors = list(PROCESS_COLORS)
+    random.Random(seed).shuffle(colors)
+    return colors
+
+
+def detect_export_format(path, allowed):
+    ext = os.path.splitext(path)[1].lower()
+    if EXPORT_FORMATS.get(ext) not in allowed:
+        expected = ", ".join(e for e, fmt in EXPORT_FORMATS.items() if fmt in allowed)
+        raise ValueError(f"Unknown export format '{ext}' (expected one of {expected})")
+    if EXPORT_FORMATS[ext] in ('parquet', 'arrow'):
+        require_pyarrow()
+    return EXPORT_FORMATS[ext]
+
+
+def require_pyarrow():
+    if pyarrow is None:
+        raise ValueError("Parquet and Arrow export need pyarrow (pip install pyarrow)")
+
+
+# Columns: (name, typecode); 'u' marks a text column
+
+def gantt_columns(result):
+    columns = [('pid', 'i'), ('process', 'u'), ('start', 'q'), ('end', 'q')]
+    if isinstance(result.gantt, CoreGanttLog):
+        columns.append(('core', 'h'))
+    return columns
+
+
+def gantt_chunks(result, chunk=EXPORT_CHUNK):
+    gantt = result.gantt
+    name = result.table.name
+    for first in range(0, max(len(gantt), 1), chunk):
+        last = first + chunk
+        pids = gantt.pids[first:last]
+        rows = {'pid': pids, 'process': [name(pid) for pid in pids],
+                'start': gantt.starts[first:last], 'end': gantt.ends[first:last]}
+        if isinstance(gantt, CoreGanttLog):
+            rows['core'] = gantt.cores[first:last]
+        yield rows
+
+
+PROCESS_COLUMNS = [('pid', 'q'), ('process', 'u'), ('arrival', 'q'), ('burst', 'q'), ('priority', 'q'),
+                   ('first_run', 'q'), ('completion', 'q'), ('turnaround', 'q'), ('waiting', 'q'),
+                   ('response', 'q')]
+
+
+def process_chunks(result, chunk=EXPORT_CHUNK):
+    table = result.table
+    for first in range(0, max(len(table), 1), chunk):
+        last = min(first + chunk, len(table))
+        arrivals = table.arrivals[first:last]
+        bursts = table.bursts[first:last]
+        first_run = result.first_run_times[first:last]
+        completion = result.completion_times[first:last]
+        turnaround = array('q', map(sub, completion, arrivals))
+        yield {'pid': array('q', range(first, last)), 'process': table.names[first:last],
+               'arrival': arrivals, 'burst': bursts, 'priority': table.priorities[first:last],
+               'first_run': first_run, 'completion': completion, 'turnaround': turnaround,
+               'waiting': array('q', map(sub, turnaround, bursts)),
+               'response': array('q', map(sub, first_run, arrivals))}
+
+
+def write_csv(path, columns, chunks):
+    fields = [name for name, _ in columns]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        for rows in chunks():
+            writer.writerows(zip(*(rows[field] for field in fields)))
+
+
+NPY_TYPES = {'h': '<i2', 'i': '<i4', 'q': '<i8'}
+
+
+def npy_header(descr, count):
+    # .npy version 1.0 header, padded so the data starts on a 64-byte boundary
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({count},), }}"
+    header += ' ' * (63 - (len(header) + 10) % 64) + '\n'
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+def write_npz(path, columns, chunks, count):
+    # One member per column; each column is streamed through the chunks
+    # again, so only one chunk is in memory at a time
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, typecode in columns:
+            if typecode == 'u':
+                width = max((len(text) for rows in chunks() for text in rows[name]), default=1)
+                descr = f'<U{width}'
+            else:
+                descr = NPY_TYPES[typecode]
+            with archive.open(name + '.npy', 'w', force_zip64=True) as member:
+                member.write(npy_header(descr, count))
+                for rows in chunks():
+                    column = rows[name]
+                    if typecode == 'u':
+                        member.write(b''.join(text.encode('utf-32-le').ljust(4 * width, b'\0')
+                                              for text in column))
+                        continue
+                    if sys.byteorder == 'big':
+                        column = array(typecode, column)
+                        column.byteswap()
+                    member.write(column.tobytes())
+
+
+def write_arrow(path, columns, chunks, fmt):
+    require_pyarrow()
+    types = {'h': pyarrow.int16(), 'i': pyarrow.int32(), 'q': pyarrow.int64(), 'u': pyarrow.string()}
+    schema = pyarrow.schema([(name, types[typecode]) for name, typecode in columns])
+    if fmt == 'parquet':
+        writer = pyarrow.parquet.ParquetWriter(path, schema)
+    else:
+        writer = pyarrow.ipc.new_file(path, schema)
+    with writer:
+        for rows in chunks():
+            batch = pyarrow.record_batch([pyarrow.array(rows[name], type=schema.field(name).type)
+                                          for name, _ in columns], schema=schema)
+            writer.write_table(pyarrow.Table.from_batches([batch]))
+
+
+def write_table(path, columns, chunks, count, fmt):
+    if fmt == 'csv':
+        write_csv(path, columns, chunks)
+    elif fmt == 'npz':
+        write_npz(path, columns, chunks, count)
+    else:
+        write_arrow(path, columns, chunks, fmt)
+
+
+def export_processes(result, path, fmt=None):
+    # Per-process times of a finished run
+    fmt = fmt or detect_export_format(path, TABLE_FORMATS)
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"Process statistics cannot be exported as {fmt}")
+    write_table(path, PROCESS_COLUMNS, lambda: process_chunks(result), len(result.table), fmt)
+
+
+def export_gantt(result, path, fmt=None, width=1200, seed=0):
+    fmt = fmt or detect_export_format(path, TABLE_FORMATS + CHART_FORMATS)
+    if not len(result.gantt) and result.makespan:
+        raise ValueError("This run was simulated without a Gantt log")
+    if fmt in CHART_FORMATS:
+        chart = GanttChart(result, width, seed)
+        (chart.write_svg if fmt == 'svg' else chart.write_png)(path)
+        return
+    write_table(path, gantt_columns(result), lambda: gantt_chunks(result), len(result.gantt), fmt)
+
+
+class GanttChart:
+    # Time runs left to right, with one row per process for small single-core
+    # runs and one row per core otherwise, as in the GUI's time usage chart
+    left = 70  # x of time 0
+    right = 20
+    top = 50  # y of the first row
+
+    def __init__(self, result, width=1200, seed=0):
+        self.result = result
+        self.width = width
+        self.colors = palette(seed)
+        self.per_process = result.cores == 1 and len(result.table) <= MAX_PROCESS_ROWS
+        if self.per_process:
+            # Rows in order of first appearance, like the GUI
+            self.rows = {}
+            for pid in result.gantt.pids:
+                self.rows.setdefault(pid, len(self.rows))
+            self.labels = [result.table.name(pid) for pid in self.rows]
+        else:
+            self.labels = [f"CPU {core}" for core in range(result.cores)]
+        rows = max(len(self.labels), 1)
+        self.pitch = max(1, min(20, MAX_CHART_HEIGHT // rows))  # row spacing
+        self.bar_height = max(1, self.pitch - (4 if self.pitch >= 10 else 0))
+        self.height = self.top + rows * self.pitch + 10
+        self.span = max(result.makespan, 1)
+        self.scale = (width - self.left - self.right) / self.span
+
+    def color(self, pid):
+        if pid == IDLE:
+            return IDLE_COLOR
+        if pid == OVERHEAD:
+            return OVERHEAD_COLOR
+        return self.colors[pid % len(self.colors)]
+
+    def spans(self):
+        # Yields (row, x1, x2, color) pixel spans. Runs of slices that share
+        # a color and touch are merged, and a slice is clipped to the pixels
+        # its row has not drawn yet, so each row yields at most one span per
+        # pixel column.
+        gantt = self.result.gantt
+        cores = gantt.cores if isinstance(gantt, CoreGanttLog) else None
+        left, scale = self.left, self.scale
+        open_spans = {}  # row -> [x1, x2, color]
+        for first in range(0, len(gantt), EXPORT_CHUNK):
+            last = first + EXPORT_CHUNK
+            for i, (pid, start, end) in enumerate(zip(gantt.pids[first:last], gantt.starts[first:last],
+                                                      gantt.ends[first:last]), first):
+                row = self.rows[pid] if self.per_process else (cores[i] if cores else 0)
+                x1 = left + int(start * scale)
+                x2 = max(left + int(end * scale), x1 + 1)
+                color = self.color(pid)
+                span = open_spans.get(row)
+                if span is not None:
+                    if color == span[2] and x1 <= span[1]:
+                        span[1] = max(span[1], x2)
+                        continue
+                    x1 = max(x1, span[1])
+                    if x1 >= x2:
+                        continue
+                    yield (row, *span)
+                open_spans[row] = [x1, x2, color]
+        for row, span in open_spans.items():
+            yield (row, *span)
+
+    def ticks(self):
+        step = max(1, self.span // 10)
+        return [(self.left + int(t * self.scale), t) for t in range(0, self.span + 1, step)]
+
+    def write_svg(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+                    f'font-family="Consolas, monospace" font-size="10">\n'
+                    f'<rect width="100%" height="100%" fill="{BACKGROUND}"/>\n')
+            axis_end = self.width - self.right
+            f.write(f'<line x1="{self.left}" y1="30" x2="{axis_end}" y2="30" stroke="{FOREGROUND}" '
+                    f'stroke-width="2"/>\n')
+            for x, t in self.ticks():
+                f.write(f'<line x1="{x}" y1="25" x2="{x}" y2="35" stroke="{FOREGROUND}"/>'
+                        f'<text x="{x}" y="45" fill="{FOREGROUND}" text-anchor="middle">{t}</text>\n')
+            for row, label in enumerate(self.labels if self.pitch >= 10 else ()):
+                f.write(f'<text x="5" y="{self.top + row * self.pitch + 12}" fill="{FOREGROUND}">'
+                        f'{escape(label)}</text>\n')
+
+            lines = []
+            for row, x1, x2, color in self.spans():
+                lines.append(f'<rect x="{x1}" y="{self.top + row * self.pitch}" width="{x2 - x1}" '
+                             f'height="{self.bar_height}" fill="{color}"/>\n')
+                if len(lines) >= EXPORT_CHUNK:
+                    f.write(''.join(lines))
+                    lines = []
+            f.write(''.join(lines))
+            f.write('</svg>\n')
+
+    def write_png(self, path):
+        # 8-bit RGB PNG written with zlib and struct; there is no font, so
+        # the chart has the axis and bars without text
+        width, height = self.width, self.height
+        stride = 3 * width
+        pixels = bytearray(rgb(BACKGROUND) * (width * height))
+
+        def fill(x1, x2, y1, y2, color):
+            x1, x2 = max(0, x1), min(width, x2)
+            if x1 >= x2:
+                return
+            run = rgb(color) * (x2 - x1)
+            for y in range(max(0, y1), min(height, y2)):
+                pixels[y * stride + 3 * x1:y * stride + 3 * x2] = run
+
+        fill(self.left, width - self.right, 29, 31, FOREGROUND)
+        for x, _ in self.ticks():
+            fill(x, x + 1, 25, 35, FOREGROUND)
+        for row, x1, x2, color in self.spans():
+            y = self.top + row * self.pitch
+            fill(x1, x2, y, y + self.bar_height, color)
+
+        with open(path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+            f.write(png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+            compressor = zlib.compressobj(6)
+            data = []
+            for y in range(height):
+                data.append(compressor.compress(b'\0' + pixels[y * stride:(y + 1) * stride]))
+            data.append(compressor.flush())
+            f.write(png_chunk(b'IDAT', b''.join(data)))
+            f.write(png_chunk(b'IEND', b''))
+
+
+def rgb(color):
+    return bytes.fromhex(color[1:7])
+
+
+def png_chunk(tag, data):
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+
+def escape(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
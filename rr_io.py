@@ -0,0 +1,187 @@
+"""Streaming workload loaders.
+
+Traces are read row by row from CSV or JSONL, or memory-mapped from the
+compact .rrb binary format, validated as they go and appended straight
+into a ProcessTable. Each row has a name, arrival and burst time and an
+optional priority.
+
+The .rrb layout is a little-endian header (magic, process count, size of
+the name block) followed by the int64 arrival, burst and priority columns
+and the newline-separated UTF-8 names.
+"""
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from rr_engine import ProcessTable
+
+BINARY_MAGIC = b'RRB1'
+BINARY_HEADER = struct.Struct('<4sQQ')
+
+FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.rrb': 'binary',
+}
+
+FIELDS = ('name', 'arrival', 'burst', 'priority')
+
+INT64_MIN = -(1 << 63)  # ProcessTable columns are int64
+INT64_MAX = (1 << 63) - 1
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Unknown trace format '{ext}' (expected one of {', '.join(FORMATS)})")
+    return FORMATS[ext]
+
+
+def integer(value):
+    # int() alone would truncate JSON 1.5 to 1 and take true as 1; CSV text
+    # like "1.5" is already rejected by int()
+    if isinstance(value, bool) or isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"not an integer: {value!r}")
+    return int(value)
+
+
+def check_row(source, line, name, arrival, burst, priority):
+    try:
+        arrival = integer(arrival)
+        burst = integer(burst)
+        priority = integer(priority) if priority not in (None, '') else 0
+    except (TypeError, ValueError):
+        raise ValueError(f"{source}, line {line}: arrival, burst and priority must be integers")
+    if max(arrival, burst, priority) > INT64_MAX or priority < INT64_MIN:
+        raise ValueError(f"{source}, line {line}: arrival, burst and priority must fit in 64 bits")
+    if arrival < 0:
+        raise ValueError(f"{source}, line {line}: arrival time must not be negative")
+    if burst <= 0:
+        raise ValueError(f"{source}, line {line}: burst time must be positive")
+    return name, arrival, burst, priority
+
+
+def iter_csv(f, source):
+    # Yields (line number, raw fields). A header row naming the columns is
+    # optional; without one the columns are name, arrival, burst[, priority]
+    columns = None
+    reader = csv.reader(f)
+    for row in reader:
+        if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+            continue
+        cells = [cell.strip() for cell in row]
+        if columns is None:
+            header = [cell.lower() for cell in cells]
+            if 'arrival' in header and 'burst' in header:
+                columns = [header.index(field) if field in header else None for field in FIELDS]
+                continue
+            columns = [0, 1, 2, 3]
+
+        yield reader.line_num, [cells[c] if c is not None and c < len(cells) else None for c in columns]
+
+
+def iter_jsonl(f, source):
+    for line, text in enumerate(f, 1):
+        text = text.strip()
+        if not text:
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"{source}, line {line}: {e}")
+        if not isinstance(record, dict):
+            raise ValueError(f"{source}, line {line}: expected a JSON object")
+        yield line, [record.get(field) for field in FIELDS]
+
+
+def iter_workload(path, fmt=None):
+    # Yields validated (name, arrival, burst, priority) rows without loading the file
+    fmt = fmt or detect_format(path)
+    if fmt == 'binary':
+        table = load_binary(path)
+        yield from zip(table.names, table.arrivals, table.bursts, table.priorities)
+        return
+
+    reader = iter_csv if fmt == 'csv' else iter_jsonl
+    with open(path, newline='', encoding='utf-8') as f:
+        for pid, (line, (name, arrival, burst, priority)) in enumerate(reader(f, path)):
+            yield check_row(path, line, str(name) if name else f"P{pid}", arrival, burst, priority)
+
+
+def load_workload(path, fmt=None):
+    fmt = fmt or detect_format(path)
+    if fmt == 'binary':
+        return load_binary(path)
+
+    table = ProcessTable()
+    for name, arrival, burst, priority in iter_workload(path, fmt):
+        table.append(name, arrival, burst, priority)
+    return table
+
+
+def load_binary(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < BINARY_HEADER.size:
+            raise ValueError(f"{path}: not a .rrb trace")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            magic, count, names_size = BINARY_HEADER.unpack_from(view, 0)
+            if magic != BINARY_MAGIC:
+                raise ValueError(f"{path}: not a .rrb trace")
+            if len(view) != BINARY_HEADER.size + 24 * count + names_size:
+                raise ValueError(f"{path}: truncated .rrb trace")
+
+            columns = []
+            offset = BINARY_HEADER.size
+            for _ in range(3):
+                column = array('q')
+                column.frombytes(view[offset:offset + 8 * count])
+                if sys.byteorder == 'big':
+                    column.byteswap()
+                columns.append(column)
+                offset += 8 * count
+            names = str(view[offset:offset + names_size], 'utf-8').split('\n') if count else []
+
+    table = ProcessTable()
+    table.names = names
+    table.arrivals, table.bursts, table.priorities = columns
+    if len(names) != count:
+        raise ValueError(f"{path}: name block does not match process count")
+    if count and min(table.arrivals) < 0:
+        raise ValueError(f"{path}: arrival time must not be negative")
+    if count and min(table.bursts) <= 0:
+        raise ValueError(f"{path}: burst time must be positive")
+    return table
+
+
+def write_workload(table, path, fmt=None):
+    fmt = fmt or detect_format(path)
+    if fmt == 'binary':
+        write_binary(table, path)
+        return
+    rows = zip(table.names, table.arrivals, table.bursts, table.priorities)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            writer.writerows(rows)
+        else:
+            f.writelines(json.dumps(dict(zip(FIELDS, row))) + '\n' for row in rows)
+
+
+def write_binary(table, path):
+    if any('\n' in name for name in table.names):
+        raise ValueError("Process names in a .rrb trace cannot contain newlines")
+    names = '\n'.join(table.names).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, len(table), len(names)))
+        for column in (table.arrivals, table.bursts, table.priorities):
+            if sys.byteorder == 'big':
+                column = array('q', column)
+                column.byteswap()
+            column.tofile(f)
+        f.write(names)
@@ -0,0 +1,286 @@
+"""Scheduling policies for the simulation engine.
+
+A policy owns the ready queue and makes the three scheduling decisions:
+which ready process runs next (pick), how long it may run (slice_length)
+and where an unfinished process goes afterwards (requeue). The engine
+handles the clock, arrivals, idle gaps and bookkeeping, so every policy
+shares the same loop.
+
+Priorities follow the usual convention that a lower number runs first.
+
+For checkpoints, save_state() returns a policy's ready queue and any
+per-process state as a list of int64 arrays, and load_state() restores
+them into a freshly built policy.
+"""
+from array import array
+from collections import deque
+from itertools import accumulate
+from heapq import heappop, heappush
+
+
+class Policy:
+    name = None
+    label = None
+    preemptive = False  # the engine ends slices early when a process arrives
+
+    def __init__(self, table, quantum):
+        self.table = table
+        self.quantum = quantum
+
+    def admit(self, pid):
+        # A process has arrived, or re-entered after its slice
+        raise NotImplementedError
+
+    def pick(self):
+        # Remove and return the next pid; the engine only calls this while
+        # some process is ready
+        raise NotImplementedError
+
+    def slice_length(self, pid, remaining):
+        return min(self.quantum, remaining)
+
+    def requeue(self, pid, remaining, ran):
+        # Called after arrivals during the slice have been admitted
+        self.admit(pid)
+
+    def for_core(self):
+        # A fresh ready queue for another core, sharing any per-process state
+        return type(self)(self.table, self.quantum)
+
+    def save_state(self):
+        raise NotImplementedError
+
+    def load_state(self, columns):
+        raise NotImplementedError
+
+
+def pack_queues(queues):
+    # Several deques as (lengths, concatenated pids)
+    return [array('q', map(len, queues)), array('q', (pid for ready in queues for pid in ready))]
+
+
+def unpack_queues(lengths, pids):
+    bounds = [0, *accumulate(lengths)]
+    return [pids[bounds[k]:bounds[k + 1]] for k in range(len(lengths))]
+
+
+class FifoPolicy(Policy):
+    # Ready processes in one deque, in arrival order. admit and pick are the
+    # deque's own methods, which saves a Python call per slice.
+    def __init__(self, table, quantum):
+        super().__init__(table, quantum)
+        self.ready = deque()
+        self.admit = self.ready.append
+        self.pick = self.ready.popleft
+
+    def save_state(self):
+        return [array('q', self.ready)]
+
+    def load_state(self, columns):
+        # admit and pick are bound to this deque, so it is refilled in place
+        self.ready.extend(columns[0])
+
+
+class RoundRobin(FifoPolicy):
+    name = 'rr'
+    label = "Round Robin"
+
+
+class FirstComeFirstServed(FifoPolicy):
+    name = 'fcfs'
+    label = "FCFS"
+
+    def slice_length(self, pid, remaining):
+        return remaining
+
+
+class HeapPolicy(Policy):
+    # Ready processes in a binary heap of (key, seq, pid); seq keeps ties in
+    # first-come order
+    def __init__(self, table, quantum):
+        super().__init__(table, quantum)
+        self.ready = []
+        self.seq = 0
+
+    def push(self, key, pid):
+        self.seq += 1
+        heappush(self.ready, (key, self.seq, pid))
+
+    def pick(self):
+        return heappop(self.ready)[2]
+
+    def save_state(self):
+        # The heap list as-is, so it is still a valid heap when restored
+        return [array('q', (entry[k] for entry in self.ready)) for k in range(3)] + [array('q', [self.seq])]
+
+    def load_state(self, columns):
+        keys, seqs, pids, (self.seq,) = columns
+        self.ready = list(zip(keys, seqs, pids))
+
+
+class ShortestJobFirst(HeapPolicy):
+    name = 'sjf'
+    label = "SJF"
+
+    def admit(self, pid):
+        self.push(self.table.bursts[pid], pid)
+
+    def slice_length(self, pid, remaining):
+        return remaining
+
+
+class ShortestRemainingTimeFirst(HeapPolicy):
+    # Slices run until the next arrival, which may preempt the running process
+    name = 'srtf'
+    label = "SRTF"
+    preemptive = True
+
+    def admit(self, pid):
+        self.push(self.table.bursts[pid], pid)
+
+    def slice_length(self, pid, remaining):
+        return remaining
+
+    def requeue(self, pid, remaining, ran):
+        # The preempted process wins ties against the arrivals that cut it short
+        heappush(self.ready, (remaining, 0, pid))
+
+
+class PriorityRoundRobin(Policy):
+    # Round Robin among the processes of the best ready priority: one deque
+    # per priority and a heap of the priorities that have ready processes
+    name = 'priority'
+    label = "Priority RR"
+
+    def __init__(self, table, quantum):
+        super().__init__(table, quantum)
+        self.queues = {}
+        self.active = []
+
+    def admit(self, pid):
+        priority = self.table.priorities[pid]
+        ready = self.queues.get(priority)
+        if ready is None:
+            ready = self.queues[priority] = deque()
+        if not ready:
+            heappush(self.active, priority)
+        ready.append(pid)
+
+    def pick(self):
+        ready = self.queues[self.active[0]]
+        pid = ready.popleft()
+        if not ready:
+            heappop(self.active)
+        return pid
+
+    def save_state(self):
+        # Only the priorities with ready processes, in heap order
+        return [array('q', self.active)] + pack_queues([self.queues[priority] for priority in self.active])
+
+    def load_state(self, columns):
+        active, lengths, pids = columns
+        self.active = list(active)
+        self.queues = {priority: deque(ready)
+                       for priority, ready in zip(active, unpack_queues(lengths, pids))}
+
+
+class MultilevelFeedbackQueue(Policy):
+    # One deque per level; level k has quantum q * 2**k. A process that uses
+    # its whole quantum drops a level, and the last level is plain Round Robin.
+    name = 'mlfq'
+    label = "MLFQ"
+
+    def __init__(self, table, quantum, levels=3, level=None):
+        super().__init__(table, quantum)
+        self.levels = [deque() for _ in range(levels)]
+        self.quanta = [quantum << k for k in range(levels)]
+        self.level = {} if level is None else level  # pid -> level, for demoted processes
+
+    def admit(self, pid):
+        self.levels[self.level.get(pid, 0)].append(pid)
+
+    def pick(self):
+        for ready in self.levels:
+            if ready:
+                return ready.popleft()
+
+    def slice_length(self, pid, remaining):
+        return min(self.quanta[self.level.get(pid, 0)], remaining)
+
+    def requeue(self, pid, remaining, ran):
+        level = self.level.get(pid, 0)
+        if ran >= self.quanta[level] and level + 1 < len(self.levels):
+            self.level[pid] = level + 1
+        self.admit(pid)
+
+    def for_core(self):
+        # Demotions follow a process that is stolen by another core
+        return type(self)(self.table, self.quantum, len(self.levels), self.level)
+
+    def save_state(self):
+        return pack_queues(self.levels) + [array('q', self.level), array('q', self.level.values())]
+
+    def load_state(self, columns):
+        # Cores share the level dict, so restoring it once per core is harmless
+        lengths, pids, demoted, levels = columns
+        self.levels = [deque(ready) for ready in unpack_queues(lengths, pids)]
+        self.level.update(zip(demoted, levels))
+
+
+class AdaptiveRoundRobin(Policy):
+    # Round Robin whose quantum is the mean remaining burst of the ready
+    # processes at each dispatch, but never below the configured quantum
+    name = 'arr'
+    label = "Adaptive RR"
+
+    def __init__(self, table, quantum):
+        super().__init__(table, quantum)
+        self.ready = deque()
+        self.remaining = {}  # pid -> remaining burst, for ready processes
+        self.total = 0
+        self.mean = quantum  # quantum for the process picked last
+
+    def admit(self, pid):
+        self.ready.append(pid)
+        remaining = self.remaining.setdefault(pid, self.table.bursts[pid])
+        self.total += remaining
+
+    def pick(self):
+        # The picked process still counts towards the mean
+        pid = self.ready.popleft()
+        self.mean = -(-self.total // (len(self.ready) + 1))
+        self.total -= self.remaining.pop(pid)
+        return pid
+
+    def slice_length(self, pid, remaining):
+        return min(max(self.quantum, self.mean), remaining)
+
+    def requeue(self, pid, remaining, ran):
+        self.remaining[pid] = remaining
+        self.admit(pid)
+
+    def save_state(self):
+        return [array('q', self.ready), array('q', map(self.remaining.__getitem__, self.ready)),
+                array('q', [self.total, self.mean])]
+
+    def load_state(self, columns):
+        ready, remaining, (self.total, self.mean) = columns
+        self.ready = deque(ready)
+        self.remaining = dict(zip(ready, remaining))
+
+
+POLICIES = {policy.name: policy for policy in (
+    RoundRobin,
+    FirstComeFirstServed,
+    ShortestJobFirst,
+    ShortestRemainingTimeFirst,
+    PriorityRoundRobin,
+    MultilevelFeedbackQueue,
+    AdaptiveRoundRobin,
+)}
+
+
+def make_policy(name, table, quantum):
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy '{name}' (expected one of {', '.join(POLICIES)})")
+    return POLICIES[name](table, quantum)
@@ -0,0 +1,184 @@
+"""Optional instrumentation for the GUI playback loop.
+
+An Instrument times named methods by shadowing them with timed wrappers on
+one object while it is attached, and removes the wrappers on detach, so an
+uninstrumented run executes the original methods untouched. Each frame's
+phase times and the gauges sampled at the end of the frame (canvas item
+counts, memory) are kept per frame. A run can be written as a Chrome trace
+(chrome://tracing or Perfetto) and, when cProfile was on, as a pstats file.
+"""
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+FrameSample = namedtuple('FrameSample', 'index time phases gauges')
+
+MAX_EVENTS = 500000  # trace events kept per run; totals are kept regardless
+TRACE_CHUNK = 10000  # events written per write() call
+
+try:
+    PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    PAGE_SIZE = 4096
+
+
+def memory_usage():
+    # Resident set size in bytes; the peak where the current size can't be
+    # read cheaply, and None when neither is available
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Instrument:
+    def __init__(self, gauges=None, on_frame=None, profile=False):
+        self.gauges = gauges  # called at the end of every frame, returns {name: value}
+        self.on_frame = on_frame  # called with each FrameSample
+        self.profiler = cProfile.Profile() if profile else None
+        self.origin = time.perf_counter()
+        self.totals = {}  # phase -> [calls, seconds], inclusive of nested phases
+        self.phases = {}  # phase -> seconds in the current frame
+        self.frames = []
+        self.events = []  # (phase, thread, start, duration) for the trace
+        self.dropped = 0
+        self.threads = {}  # thread ident -> name, for the threads that attached
+        self.wrapped = []  # (obj, name, shadowed instance attribute or None)
+        self.frame_name = None
+
+    def wrap(self, obj, *names):
+        for name in names:
+            self.wrapped.append((obj, name, obj.__dict__.get(name)))
+            setattr(obj, name, self.timed(name, getattr(obj, name)))
+
+    def wrap_frame(self, obj, name):
+        # Like wrap, and the call also closes a frame. The wrapper replaces
+        # the method on the instance, so a loop that reschedules itself
+        # through self.<name> stays instrumented.
+        timed = self.timed(name, getattr(obj, name))
+        self.frame_name = name
+
+        def frame(*args, **kwargs):
+            try:
+                return timed(*args, **kwargs)
+            finally:
+                self.end_frame()
+        self.wrapped.append((obj, name, obj.__dict__.get(name)))
+        setattr(obj, name, frame)
+
+    def timed(self, name, method):
+        totals = self.totals.setdefault(name, [0, 0.0])
+        events = self.events
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            started = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - started
+                totals[0] += 1
+                totals[1] += elapsed
+                phases = self.phases
+                phases[name] = phases.get(name, 0.0) + elapsed
+                if len(events) < MAX_EVENTS:
+                    events.append((name, threading.get_ident(), started, elapsed))
+                else:
+                    self.dropped += 1
+        return timed
+
+    def attach(self):
+        self.threads.setdefault(threading.get_ident(), threading.current_thread().name)
+        if self.profiler:
+            self.profiler.enable()
+
+    def detach(self):
+        # Restore the original methods and stop profiling; the samples stay
+        if self.profiler:
+            self.profiler.disable()
+        for obj, name, shadowed in reversed(self.wrapped):
+            if shadowed is None:
+                obj.__dict__.pop(name, None)
+            else:
+                setattr(obj, name, shadowed)
+        self.wrapped = []
+
+    def end_frame(self):
+        gauges = self.gauges() if self.gauges else {}
+        sample = FrameSample(len(self.frames), time.perf_counter() - self.origin, self.phases, gauges)
+        self.phases = {}
+        self.frames.append(sample)
+        if self.on_frame:
+            self.on_frame(sample)
+
+    def summary(self):
+        wall = max(time.perf_counter() - self.origin, 1e-9)
+        lines = [f"{'Phase':<22}{'Calls':>10}{'Total ms':>12}{'Mean ms':>10}{'Wall %':>8}"]
+        for name, (calls, seconds) in sorted(self.totals.items(), key=lambda item: -item[1][1]):
+            if calls:
+                lines.append(f"{name:<22}{calls:>10}{seconds * 1e3:>12.1f}"
+                             f"{seconds / calls * 1e3:>10.3f}{seconds / wall * 100:>8.1f}")
+        lines.append(f"Frames: {len(self.frames)}  Wall: {wall:.2f}s  Phases are inclusive of nested calls")
+        if self.frames:
+            last = self.frames[-1]
+            slowest = max(self.frames, key=lambda frame: frame.phases.get(self.frame_name, 0.0))
+            lines.append(f"Slowest frame: #{slowest.index} "
+                         f"({slowest.phases.get(self.frame_name, 0.0) * 1e3:.1f} ms)")
+            for key, value in last.gauges.items():
+                lines.append(f"{key}: {value / 2 ** 20:.1f} MB" if key.endswith('bytes') and value
+                             else f"{key}: {value}")
+        if self.dropped:
+            lines.append(f"Trace truncated: {self.dropped} events over {MAX_EVENTS} not kept")
+        return lines
+
+    def write_chrome_trace(self, path):
+        # Trace Event Format: one complete ("X") event per timed call and one
+        # counter ("C") event per frame gauge, streamed out in chunks
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"displayTimeUnit":"ms","traceEvents":[\n')
+            separator = ""
+            for chunk in self.trace_records():
+                f.write(separator + ",\n".join(chunk))
+                separator = ",\n"
+            f.write("\n]}\n")
+
+    def trace_records(self):
+        # Trace events as JSON strings, in lists of up to TRACE_CHUNK
+        origin = self.origin
+        records = [json.dumps({'name': 'thread_name', 'ph': 'M', 'pid': 0, 'tid': tid,
+                               'args': {'name': name}})
+                   for tid, name in self.threads.items()]
+        for name, tid, started, elapsed in self.events:
+            records.append(f'{{"name":{json.dumps(name)},"ph":"X","pid":0,"tid":{tid},'
+                           f'"ts":{(started - origin) * 1e6:.1f},"dur":{elapsed * 1e6:.1f}}}')
+            if len(records) >= TRACE_CHUNK:
+                yield records
+                records = []
+        for frame in self.frames:
+            if frame.gauges:
+                records.append(json.dumps({'name': 'gauges', 'ph': 'C', 'pid': 0,
+                                           'ts': round(frame.time * 1e6, 1), 'args': frame.gauges}))
+            if len(records) >= TRACE_CHUNK:
+                yield records
+                records = []
+        if records:
+            yield records
+
+    def write_pstats(self, path):
+        if self.profiler is None:
+            raise ValueError("This run was instrumented without cProfile")
+        self.profiler.dump_stats(path)
@@ -0,0 +1,208 @@
+"""Whole-run statistics over a SimulationResult's columns.
+
+The per-process columns are computed with array-at-a-time operations: NumPy
+when it is installed, otherwise C-level map()/sorted() passes over the
+stdlib arrays. Both paths give identical numbers.
+
+StreamStats keeps the same figures as online aggregates (running moments and
+quantile sketches) for streaming runs that never hold every process.
+"""
+from array import array
+from math import ceil, log, sqrt
+from operator import sub
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, p):
+    # Nearest-rank percentile of an already sorted column
+    if not len(sorted_values):
+        return 0
+    rank = max(1, ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RunStats:
+    def __init__(self, result):
+        table = result.table
+        self.count = len(table)
+        self.makespan = result.makespan
+
+        if np is not None:
+            arrivals = np.frombuffer(table.arrivals, dtype=np.int64)
+            bursts = np.frombuffer(table.bursts, dtype=np.int64)
+            completion = np.frombuffer(result.completion_times, dtype=np.int64)
+            first_run = np.frombuffer(result.first_run_times, dtype=np.int64)
+            self.turnaround_times = completion - arrivals
+            self.waiting_times = self.turnaround_times - bursts
+            self.response_times = first_run - arrivals
+            self.busy_time = int(bursts.sum())
+            total_turnaround = int(self.turnaround_times.sum())
+            total_waiting = int(self.waiting_times.sum())
+            total_response = int(self.response_times.sum())
+            sorted_waiting = np.sort(self.waiting_times)
+            sorted_response = np.sort(self.response_times)
+        else:
+            self.turnaround_times = array('q', map(sub, result.completion_times, table.arrivals))
+            self.waiting_times = array('q', map(sub, self.turnaround_times, table.bursts))
+            self.response_times = array('q', map(sub, result.first_run_times, table.arrivals))
+            self.busy_time = sum(table.bursts)
+            total_turnaround = sum(self.turnaround_times)
+            total_waiting = sum(self.waiting_times)
+            total_response = sum(self.response_times)
+            sorted_waiting = sorted(self.waiting_times)
+            sorted_response = sorted(self.response_times)
+
+        n = self.count or 1
+        self.avg_turnaround = total_turnaround / n
+        self.avg_waiting = total_waiting / n
+        self.avg_response = total_response / n
+        self.waiting_percentiles = {p: int(percentile(sorted_waiting, p)) for p in PERCENTILES}
+        self.response_percentiles = {p: int(percentile(sorted_response, p)) for p in PERCENTILES}
+
+        # Processes completed per time unit, and the share of the makespan the
+        # CPUs were busy, whether with useful work or dispatch overhead
+        self.cores = result.cores
+        self.overhead_time = result.overhead_time
+        capacity = self.makespan * self.cores
+        occupied = self.busy_time + self.overhead_time
+        self.throughput = self.count / self.makespan if self.makespan else 0.0
+        self.cpu_utilization = occupied / capacity if capacity else 0.0
+
+        # How much of the CPUs' busy time went to switching, and the useful
+        # work actually delivered per time unit
+        self.overhead_share = self.overhead_time / occupied if occupied else 0.0
+        self.effective_throughput = self.busy_time / self.makespan if self.makespan else 0.0
+
+        # Per-core load; imbalance is how far the busiest core is above the mean
+        self.core_utilization = [busy / self.makespan if self.makespan else 0.0 for busy in result.core_busy]
+        mean_busy = occupied / self.cores
+        self.load_imbalance = max(result.core_busy) / mean_busy - 1 if mean_busy else 0.0
+        self.migrations = result.migrations
+        self.core_switches = list(result.core_switches)
+
+    def summary(self):
+        lines = [
+            "Average Turnaround Time: {:.2f}".format(self.avg_turnaround),
+            "Average Waiting Time: {:.2f}".format(self.avg_waiting),
+            "Average Response Time: {:.2f}".format(self.avg_response),
+            "Waiting  p50/p95/p99: {}/{}/{}".format(*(self.waiting_percentiles[p] for p in PERCENTILES)),
+            "Response p50/p95/p99: {}/{}/{}".format(*(self.response_percentiles[p] for p in PERCENTILES)),
+            "Throughput: {:.4f} processes/unit".format(self.throughput),
+            "CPU Utilization: {:.1f}%".format(self.cpu_utilization * 100),
+            "Overhead: {:.1f}% of busy time ({} units)".format(self.overhead_share * 100, self.overhead_time),
+            "Effective Throughput: {:.4f} work units/unit".format(self.effective_throughput),
+        ]
+        if self.cores > 1:
+            lines.extend([
+                "Per-core Utilization min/max: {:.1f}%/{:.1f}%".format(
+                    min(self.core_utilization) * 100, max(self.core_utilization) * 100),
+                "Load Imbalance: {:.1f}%".format(self.load_imbalance * 100),
+                "Migrations: {}".format(self.migrations),
+                "Per-core Context Switches min/max: {}/{}".format(min(self.core_switches),
+                                                                  max(self.core_switches)),
+            ])
+        return lines
+
+
+def compute_stats(result):
+    return RunStats(result)
+
+
+class RunningMoments:
+    # Welford's online mean and variance
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return sqrt(self.variance)
+
+
+class QuantileSketch:
+    # Log-bucketed sketch of non-negative values: quantiles are within
+    # `accuracy` relative error and memory grows with log(max value) only
+    def __init__(self, accuracy=0.01):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, value):
+        self.count += 1
+        if value <= 0:
+            self.zeros += 1
+            return
+        key = ceil(log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def percentile(self, p):
+        # Nearest-rank, like percentile() on a sorted column
+        if not self.count:
+            return 0
+        rank = max(1, ceil(p / 100 * self.count))
+        seen = self.zeros
+        if seen >= rank:
+            return 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 0
+
+
+class StreamStats:
+    # Online counterpart of RunStats for runs whose processes are not kept
+    def __init__(self, accuracy=0.01):
+        self.count = 0
+        self.busy_time = 0
+        self.makespan = 0
+        self.turnaround = RunningMoments()
+        self.waiting = RunningMoments()
+        self.response = RunningMoments()
+        self.waiting_sketch = QuantileSketch(accuracy)
+        self.response_sketch = QuantileSketch(accuracy)
+
+    def add(self, arrival, burst, first_run, completion):
+        turnaround = completion - arrival
+        self.count += 1
+        self.busy_time += burst
+        self.makespan = max(self.makespan, completion)
+        self.turnaround.add(turnaround)
+        self.waiting.add(turnaround - burst)
+        self.response.add(first_run - arrival)
+        self.waiting_sketch.add(turnaround - burst)
+        self.response_sketch.add(first_run - arrival)
+
+    def summary(self):
+        throughput = self.count / self.makespan if self.makespan else 0.0
+        utilization = self.busy_time / self.makespan if self.makespan else 0.0
+        return [
+            "Average Turnaround Time: {:.2f} (sd {:.2f})".format(self.turnaround.mean, self.turnaround.stdev),
+            "Average Waiting Time: {:.2f} (sd {:.2f})".format(self.waiting.mean, self.waiting.stdev),
+            "Average Response Time: {:.2f} (sd {:.2f})".format(self.response.mean, self.response.stdev),
+            "Waiting  p50/p95/p99: {:.0f}/{:.0f}/{:.0f}".format(
+                *(self.waiting_sketch.percentile(p) for p in PERCENTILES)),
+            "Response p50/p95/p99: {:.0f}/{:.0f}/{:.0f}".format(
+                *(self.response_sketch.percentile(p) for p in PERCENTILES)),
+            "Throughput: {:.4f} processes/unit".format(throughput),
+            "CPU Utilization: {:.1f}%".format(utilization * 100),
+        ]
@@ -0,0 +1,102 @@
+"""Streaming Round Robin for unbounded arrival streams.
+
+Arrivals are pulled lazily from any iterable of (name, arrival, burst[,
+priority]) rows in non-decreasing arrival order. Each process is emitted as
+a CompletedProcess and forgotten as soon as it finishes, and the run's
+statistics are kept as online aggregates, so memory depends on the number
+of live processes rather than on the length of the stream.
+"""
+from collections import deque, namedtuple
+
+from rr_stats import StreamStats
+
+CompletedProcess = namedtuple('CompletedProcess', 'name arrival burst first_run completion')
+
+# Live process record fields
+SEQ, NAME, ARRIVAL, BURST, REMAINING, FIRST_RUN = range(6)
+
+
+class StreamSimulation:
+    def __init__(self, rows, quantum, accuracy=0.01):
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive")
+        self.rows = iter(rows)
+        self.quantum = quantum
+        self.stats = StreamStats(accuracy)
+        self.time = 0
+        self.live = 0  # processes that have arrived and not completed
+        self.admitted = 0
+        self.idle_time = 0
+        self.context_switches = 0
+
+    def __iter__(self):
+        return self.completions()
+
+    def run(self):
+        # Drain the stream when only the aggregates are wanted
+        for _ in self.completions():
+            pass
+        return self.stats
+
+    def next_process(self, after):
+        row = next(self.rows, None)
+        if row is None:
+            return None
+        name, arrival, burst = row[0], int(row[1]), int(row[2])
+        if arrival < 0:
+            raise ValueError(f"Arrival time of {name} must not be negative")
+        if arrival < after:
+            raise ValueError(f"Arrivals must be in time order: {name} arrives at {arrival} after {after}")
+        if burst <= 0:
+            raise ValueError(f"Burst time of {name} must be positive")
+        self.admitted += 1
+        return [self.admitted, name, arrival, burst, burst, -1]
+
+    def completions(self):
+        quantum = self.quantum
+        stats = self.stats
+        queue = deque()
+        pending = self.next_process(0)
+        last = 0  # sequence number of the last dispatched process
+        time = 0
+
+        while True:
+            while pending is not None and pending[ARRIVAL] <= time:
+                queue.append(pending)
+                pending = self.next_process(pending[ARRIVAL])
+            self.live = len(queue)
+
+            if not queue:
+                if pending is None:
+                    break
+                self.idle_time += pending[ARRIVAL] - time
+                time = pending[ARRIVAL]
+                continue
+
+            process = queue.popleft()
+            if process[FIRST_RUN] < 0:
+                process[FIRST_RUN] = time
+            if process[SEQ] != last:
+                if last:
+                    self.context_switches += 1
+                last = process[SEQ]
+
+            exec_time = min(quantum, process[REMAINING])
+            process[REMAINING] -= exec_time
+            time += exec_time
+            self.time = time
+
+            # Arrivals during the slice queue up ahead of the preempted process
+            while pending is not None and pending[ARRIVAL] <= time:
+                queue.append(pending)
+                pending = self.next_process(pending[ARRIVAL])
+
+            if process[REMAINING] > 0:
+                queue.append(process)
+            else:
+                stats.add(process[ARRIVAL], process[BURST], process[FIRST_RUN], time)
+                self.live = len(queue)
+                yield CompletedProcess(process[NAME], process[ARRIVAL], process[BURST],
+                                       process[FIRST_RUN], time)
+
+        self.time = time
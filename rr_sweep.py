@@ -0,0 +1,104 @@
+"""Quantum sweeps: run one workload under many time quanta in parallel.
+
+Every point is an independent gantt-free simulation, so the sweep is spread
+over a process pool with the workload shipped to each worker once.
+"""
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from rr_engine import make_engine, simulate_table
+from rr_stats import compute_stats
+
+SWEEP_COLUMNS = [
+    'quantum',
+    'avg_waiting', 'p50_waiting', 'p95_waiting', 'p99_waiting',
+    'avg_turnaround',
+    'avg_response', 'p50_response', 'p95_response', 'p99_response',
+    'context_switches',
+    'overhead_share', 'effective_throughput',
+]
+
+# Workload and scheduler settings of the current pool worker, set once by the initializer
+_worker_table = None
+_worker_settings = ()
+
+
+def parse_quanta(text):
+    # "2,4,8", "1-20" and "1-100:5" (start-stop:step, inclusive) may be mixed
+    quanta = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            span, _, step = part.partition(':')
+            start, _, stop = span.partition('-')
+            start, stop, step = int(start), int(stop), int(step) if step else 1
+            if stop < start or step <= 0:
+                raise ValueError(f"Invalid quantum range '{part}' (expected start-stop:step with "
+                                 f"start <= stop and a positive step)")
+            quanta.extend(range(start, stop + 1, step))
+        else:
+            quanta.append(int(part))
+    if not quanta:
+        raise ValueError("No quanta given")
+    if min(quanta) <= 0:
+        raise ValueError("Quantum must be positive")
+    return quanta
+
+
+def sweep_point(table, quantum, policy='rr', cores=1, queues='global', switch_cost=0, warmup=0):
+    result = simulate_table(table, quantum, gantt=False, policy=policy, cores=cores, queues=queues,
+                            switch_cost=switch_cost, warmup=warmup)
+    stats = compute_stats(result)
+    return {
+        'quantum': quantum,
+        'avg_waiting': stats.avg_waiting,
+        'p50_waiting': stats.waiting_percentiles[50],
+        'p95_waiting': stats.waiting_percentiles[95],
+        'p99_waiting': stats.waiting_percentiles[99],
+        'avg_turnaround': stats.avg_turnaround,
+        'avg_response': stats.avg_response,
+        'p50_response': stats.response_percentiles[50],
+        'p95_response': stats.response_percentiles[95],
+        'p99_response': stats.response_percentiles[99],
+        'context_switches': result.context_switches,
+        'overhead_share': stats.overhead_share,
+        'effective_throughput': stats.effective_throughput,
+    }
+
+
+def _init_worker(table, settings):
+    global _worker_table, _worker_settings
+    _worker_table = table
+    _worker_settings = settings
+
+
+def _run_worker_point(quantum):
+    return sweep_point(_worker_table, quantum, *_worker_settings)
+
+
+def sweep(table, quanta, workers=None, policy='rr', cores=1, queues='global', switch_cost=0, warmup=0):
+    # One row per quantum, in the order given; workers=1 runs in-process
+    quanta = list(quanta)
+    if not quanta:
+        return []
+    # Fail here rather than in every worker
+    make_engine(table, min(quanta), False, policy, cores, queues, switch_cost, warmup)
+    settings = (policy, cores, queues, switch_cost, warmup)
+    workers = min(workers or os.cpu_count() or 1, len(quanta))
+    if workers <= 1:
+        return [sweep_point(table, quantum, *settings) for quantum in quanta]
+
+    chunksize = max(1, len(quanta) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(table, settings)) as pool:
+        return list(pool.map(_run_worker_point, quanta, chunksize=chunksize))
+
+
+def write_sweep_csv(rows, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SWEEP_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,122 @@
+"""Seeded synthetic workloads.
+
+generate() builds a ProcessTable from an arrival model and a burst-time
+distribution. Every draw comes from one random.Random(seed), so the same
+arguments always give the same workload.
+
+    python rr_workload.py 100000 trace.rrb --arrivals bursty --bursts pareto --seed 7
+"""
+import argparse
+import random
+import sys
+from array import array
+from math import ceil, log
+
+from rr_engine import ProcessTable
+from rr_io import FORMATS, write_workload
+
+ARRIVAL_MODELS = ('poisson', 'bursty')
+BURST_MODELS = ('exponential', 'pareto', 'bimodal')
+
+PARETO_ALPHA = 1.5  # tail index of the heavy-tailed bursts; the variance is infinite
+BIMODAL_SHORT = 0.8  # share of short jobs in the bimodal mix
+
+
+def poisson_arrivals(rng, n, rate):
+    # Exponential gaps, so arrivals form a Poisson process of the given rate
+    time = 0.0
+    for _ in range(n):
+        time += rng.expovariate(rate)
+        yield int(time)
+
+
+def bursty_arrivals(rng, n, rate, cluster=8):
+    # Clusters of a geometric number of processes (mean `cluster`) separated
+    # by quiet gaps; inside a cluster arrivals are `cluster` times denser than
+    # `rate`, and the gaps are sized so the long-run rate is still `rate`
+    time = 0.0
+    produced = 0
+    log_stay = log(1 - 1 / cluster)
+    while produced < n:
+        time += rng.expovariate(rate / (cluster - 1))
+        size = 1 + int(log(1.0 - rng.random()) / log_stay)
+        for _ in range(min(size, n - produced)):
+            yield int(time)
+            time += rng.expovariate(rate * cluster)
+            produced += 1
+
+
+def exponential_bursts(rng, n, mean):
+    for _ in range(n):
+        yield max(1, round(rng.expovariate(1 / mean)))
+
+
+def pareto_bursts(rng, n, mean):
+    # Pareto with scale chosen so the distribution mean is `mean`
+    scale = mean * (PARETO_ALPHA - 1) / PARETO_ALPHA
+    for _ in range(n):
+        yield max(1, ceil(scale * rng.paretovariate(PARETO_ALPHA)))
+
+
+def bimodal_bursts(rng, n, mean):
+    # Mostly short interactive jobs with a minority of long batch jobs; both
+    # modes are exponential and the mixture mean is `mean`
+    short = mean / 4
+    long = (mean - BIMODAL_SHORT * short) / (1 - BIMODAL_SHORT)
+    for _ in range(n):
+        mode = short if rng.random() < BIMODAL_SHORT else long
+        yield max(1, round(rng.expovariate(1 / mode)))
+
+
+ARRIVALS = {'poisson': poisson_arrivals, 'bursty': bursty_arrivals}
+BURSTS = {'exponential': exponential_bursts, 'pareto': pareto_bursts, 'bimodal': bimodal_bursts}
+
+
+def generate(n, arrivals='poisson', bursts='exponential', mean_burst=10, load=0.9,
+             priority_levels=4, seed=0):
+    # `load` is the offered work per time unit: 0.9 keeps one CPU 90% busy,
+    # and N cores need about N times that to stay loaded
+    if n < 0:
+        raise ValueError("Process count must not be negative")
+    if arrivals not in ARRIVALS:
+        raise ValueError(f"Unknown arrival model '{arrivals}' (expected one of {', '.join(ARRIVAL_MODELS)})")
+    if bursts not in BURSTS:
+        raise ValueError(f"Unknown burst distribution '{bursts}' (expected one of {', '.join(BURST_MODELS)})")
+    if mean_burst < 1 or load <= 0 or priority_levels < 1:
+        raise ValueError("Mean burst must be at least 1, and load and priority levels positive")
+
+    rng = random.Random(seed)
+    table = ProcessTable()
+    table.names = [f"P{i}" for i in range(n)]
+    table.arrivals = array('q', ARRIVALS[arrivals](rng, n, load / mean_burst))
+    table.bursts = array('q', BURSTS[bursts](rng, n, mean_burst))
+    table.priorities = array('q', (rng.randrange(priority_levels) for _ in range(n)))
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic workload trace")
+    parser.add_argument('count', type=int, help="number of processes")
+    parser.add_argument('output', help="trace to write (" + ", ".join(FORMATS) + ")")
+    parser.add_argument('--arrivals', choices=ARRIVAL_MODELS, default='poisson')
+    parser.add_argument('--bursts', choices=BURST_MODELS, default='exponential')
+    parser.add_argument('--mean-burst', type=float, default=10, help="mean burst time (default: 10)")
+    parser.add_argument('--load', type=float, default=0.9,
+                        help="offered work per time unit (default: 0.9)")
+    parser.add_argument('--priorities', type=int, default=4, help="number of priority levels (default: 4)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        table = generate(args.count, args.arrivals, args.bursts, args.mean_burst, args.load,
+                         args.priorities, args.seed)
+        write_workload(table, args.output)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(f"Wrote {len(table)} processes to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Checkpoint round trips: a resumed run must match an uninterrupted one.
+
+    python -m unittest test_rr_checkpoint
+"""
+import io
+import os
+import tempfile
+import unittest
+
+from rr_checkpoint import load_checkpoint, read_checkpoint, save_checkpoint, write_checkpoint
+from rr_engine import make_engine
+from rr_policy import POLICIES
+from rr_workload import generate
+
+SETTINGS = [
+    # (cores, queues, switch_cost, warmup)
+    (1, 'global', 0, 0),
+    (1, 'global', 2, 1),
+    (3, 'global', 0, 0),
+    (3, 'per-core', 1, 2),
+]
+RESULT_FIELDS = ('completion_times', 'first_run_times', 'makespan', 'idle_time', 'context_switches',
+                 'core_switches', 'core_busy', 'migrations', 'overhead_time')
+
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.table = generate(120, arrivals='bursty', bursts='bimodal', seed=11)
+
+    def engine(self, policy, cores, queues, switch_cost, warmup):
+        return make_engine(self.table, 3, True, policy, cores, queues, switch_cost, warmup)
+
+    def assertSameRun(self, result, reference):
+        for field in RESULT_FIELDS:
+            self.assertEqual(getattr(result, field), getattr(reference, field), field)
+        self.assertEqual(list(result.gantt), list(reference.gantt))
+        if reference.cores > 1:
+            self.assertEqual(result.gantt.cores, reference.gantt.cores)
+
+    def test_resume_matches_uninterrupted_run(self):
+        for policy in POLICIES:
+            for settings in SETTINGS:
+                reference = self.engine(policy, *settings).run()
+                for stop in (0, reference.makespan // 3, reference.makespan * 2 // 3):
+                    with self.subTest(policy=policy, settings=settings, stop=stop):
+                        engine = self.engine(policy, *settings)
+                        engine.step(until=stop)
+                        buffer = io.BytesIO()
+                        write_checkpoint(engine, buffer, extra={'note': stop})
+                        buffer.seek(0)
+                        resumed, extra = read_checkpoint(buffer, "test")
+                        self.assertEqual(extra, {'note': stop})
+                        self.assertEqual(resumed.time, engine.time)
+                        resumed.step()
+                        self.assertTrue(resumed.done)
+                        self.assertSameRun(resumed.result, reference)
+
+    def test_without_workload_or_gantt(self):
+        reference = self.engine('mlfq', 3, 'per-core', 1, 1).run()
+        engine = self.engine('mlfq', 3, 'per-core', 1, 1)
+        engine.step(until=reference.makespan // 2)
+        buffer = io.BytesIO()
+        write_checkpoint(engine, buffer, gantt=False, table=False)
+
+        buffer.seek(0)
+        with self.assertRaises(ValueError):
+            read_checkpoint(buffer, "test")
+        buffer.seek(0)
+        resumed, _ = read_checkpoint(buffer, "test", self.table)
+        resumed.step()
+        self.assertEqual(resumed.result.completion_times, reference.completion_times)
+        self.assertEqual(resumed.result.context_switches, reference.context_switches)
+
+    def test_file_round_trip_and_damage(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.rrc")
+            engine = self.engine('rr', 1, 'global', 0, 0)
+            engine.step(until=100)
+            save_checkpoint(engine, path, extra={'position': 7})
+            resumed, extra = load_checkpoint(path)
+            self.assertEqual(extra, {'position': 7})
+            self.assertEqual(resumed.result.table.names, self.table.names)
+
+            with open(path, 'rb') as f:
+                data = f.read()
+            for name, damaged in (("magic", b'XXXX' + data[4:]), ("truncated", data[:-40]),
+                                  ("short", data[:5])):
+                with self.subTest(name):
+                    with open(path, 'wb') as f:
+                        f.write(damaged)
+                    with self.assertRaises(ValueError):
+                        load_checkpoint(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Equivalence checks for the engine's shortcuts.
+
+    python -m unittest test_rr_engine
+"""
+import random
+import unittest
+
+from rr_engine import ProcessTable, closed_form, make_engine, simulate_table
+
+RESULT_FIELDS = ('completion_times', 'first_run_times', 'context_switches', 'idle_time', 'makespan',
+                 'core_busy')
+
+
+def batch_workload(rng, overlap=False):
+    # Batches of simultaneous arrivals, each arriving once the previous one
+    # has drained unless `overlap` lets one arrive early
+    table = ProcessTable()
+    time = rng.randrange(5)
+    for _ in range(rng.randint(1, 6)):
+        bursts = [rng.randint(1, 30) for _ in range(rng.randint(1, 12))]
+        for burst in bursts:
+            table.append(f"P{len(table)}", time, burst)
+        time += sum(bursts) + rng.randrange(10)
+        if overlap:
+            time -= rng.randint(1, sum(bursts))
+    # Arrival order must not depend on the order of the rows
+    rows = list(zip(table.names, table.arrivals, table.bursts))
+    rng.shuffle(rows)
+    return ProcessTable(*zip(*rows))
+
+
+class ClosedFormTest(unittest.TestCase):
+    def closed_form_result(self, table, quantum):
+        engine = make_engine(table, quantum, gantt=False)
+        return closed_form(table, quantum, engine.arrival_order, engine.result), engine.result
+
+    def test_matches_simulation(self):
+        rng = random.Random(9)
+        for _ in range(500):
+            table = batch_workload(rng)
+            quantum = rng.randint(1, 12)
+            solved, result = self.closed_form_result(table, quantum)
+            self.assertTrue(solved)
+            simulated = simulate_table(table, quantum, gantt=True)
+            for field in RESULT_FIELDS:
+                self.assertEqual(getattr(result, field), getattr(simulated, field),
+                                 f"{field} differs at quantum {quantum} for {list(table.arrivals)}, "
+                                 f"{list(table.bursts)}")
+
+    def test_declines_overlapping_batches(self):
+        rng = random.Random(4)
+        declined = 0
+        for _ in range(200):
+            table = batch_workload(rng, overlap=True)
+            solved, result = self.closed_form_result(table, 4)
+            if not solved:
+                declined += 1
+                self.assertEqual(result.makespan, 0)
+                self.assertFalse(any(result.completion_times))
+            # Either way simulate_table gives the simulated answer
+            self.assertEqual(simulate_table(table, 4, gantt=False).completion_times,
+                             simulate_table(table, 4, gantt=True).completion_times)
+        self.assertTrue(declined)
+
+
+if __name__ == "__main__":
+    unittest.main()
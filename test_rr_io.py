@@ -0,0 +1,89 @@
+"""Round trips of the trace formats and their validation.
+
+    python -m unittest test_rr_io
+"""
+import os
+import tempfile
+import unittest
+
+from rr_engine import ProcessTable
+from rr_io import INT64_MAX, load_workload, write_workload
+from rr_workload import generate
+
+
+def sample_table():
+    table = generate(300, bursts='pareto', seed=3)
+    table.names[:3] = ["Ünïcode ✓", "with,comma", "with \"quotes\""]
+    table.append("big", INT64_MAX - 1, INT64_MAX, -5)
+    return table
+
+
+class TraceFormatTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write(self, name, text):
+        with open(self.path(name), 'w', encoding='utf-8') as f:
+            f.write(text)
+        return self.path(name)
+
+    def assertSameTable(self, loaded, table):
+        self.assertEqual(loaded.names, table.names)
+        self.assertEqual(loaded.arrivals, table.arrivals)
+        self.assertEqual(loaded.bursts, table.bursts)
+        self.assertEqual(loaded.priorities, table.priorities)
+
+    def test_round_trips(self):
+        table = sample_table()
+        for ext in ('.rrb', '.csv', '.jsonl'):
+            with self.subTest(ext):
+                path = self.path("trace" + ext)
+                write_workload(table, path)
+                self.assertSameTable(load_workload(path), table)
+
+    def test_empty_binary_trace(self):
+        path = self.path("empty.rrb")
+        write_workload(ProcessTable(), path)
+        self.assertSameTable(load_workload(path), ProcessTable())
+
+    def test_damaged_binary_trace(self):
+        path = self.path("trace.rrb")
+        write_workload(sample_table(), path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        for name, damaged in (("magic", b'XXXX' + data[4:]), ("truncated", data[:-3]), ("short", data[:10])):
+            with self.subTest(name):
+                with open(path, 'wb') as f:
+                    f.write(damaged)
+                with self.assertRaises(ValueError):
+                    load_workload(path)
+
+    def test_newline_in_binary_name(self):
+        with self.assertRaises(ValueError):
+            write_workload(ProcessTable(["a\nb"], [0], [1]), self.path("bad.rrb"))
+
+    def test_rejects_invalid_values(self):
+        rows = {
+            'fraction': ('A,0,1.5', '{"name": "A", "arrival": 0, "burst": 1.5}'),
+            'boolean': ('A,true,2', '{"name": "A", "arrival": true, "burst": 2}'),
+            'overflow': ('A,0,99999999999999999999', '{"name": "A", "arrival": 0, "burst": 1e300}'),
+            'negative arrival': ('A,-1,2', '{"name": "A", "arrival": -1, "burst": 2}'),
+            'zero burst': ('A,0,0', '{"name": "A", "arrival": 0, "burst": 0}'),
+        }
+        for case, (csv_row, json_row) in rows.items():
+            for name, text in (("bad.csv", csv_row), ("bad.jsonl", json_row)):
+                with self.subTest(case=case, format=name):
+                    with self.assertRaisesRegex(ValueError, r", line 1: "):
+                        load_workload(self.write(name, text + "\n"))
+
+    def test_accepts_integral_json_floats(self):
+        table = load_workload(self.write("ok.jsonl", '{"name": "A", "arrival": 2.0, "burst": 3}\n'))
+        self.assertEqual(list(table.arrivals), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()